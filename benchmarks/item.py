@@ -0,0 +1,127 @@
+# <> with ❤️ by Micha Grandel - hello@michagrandel.eu
+""" Micro-benchmark for reading derived representations of plywoodpirate Items
+
+Reads ``string``, ``integer``, ``original`` and iterates over the same Items many
+times, like config and protocol layers do with ``ItemDict`` values. As baseline, the
+same representations are decoded from the raw bytes on every access, which is what
+``Item`` did before its representations were cached.
+
+Results are written as JSON to stdout or to ``--output``.
+
+Example:
+    ```
+    python benchmarks/item.py --items 1000 --repeat 5 --output item.json
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from plywoodpirate.collections.item import ENCODE, Item
+
+
+def decode_string(item: Item) -> str:
+    return item.raw.decode(ENCODE)
+
+
+def decode_integer(item: Item):
+    if issubclass(item._type, int) or decode_string(item).isdigit():
+        return int(item.raw)
+    return None
+
+
+def decode_original(item: Item):
+    if item._type is str:
+        return decode_string(item)
+    elif item._type is type(None):
+        return None
+    return item._type(item.raw)
+
+
+def decode_iter(item: Item):
+    return iter(decode_string(item))
+
+
+def measure(func: Callable, items: List[Item], repeat: int, number: int) -> float:
+    """
+    Best time in nanoseconds to call ``func`` once per item.
+    """
+    def loop():
+        for item in items:
+            func(item)
+
+    best = min(timeit.repeat(loop, repeat=repeat, number=number))
+    return best / number / len(items) * 1e9
+
+
+def run(args: argparse.Namespace) -> Dict:
+    items = []
+    for i in range(args.items):
+        items.append(Item("value-{}".format(i)))
+        items.append(Item(str(i)))
+        items.append(Item(i))
+
+    cases = {
+        "string": (lambda item: item.string, decode_string),
+        "integer": (lambda item: item.integer, decode_integer),
+        "original": (lambda item: item.original, decode_original),
+        "iter": (lambda item: iter(item), decode_iter),
+    }
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "items": len(items),
+            "repeat": args.repeat,
+        },
+        "reads": [],
+    }
+    for name, (cached, baseline) in cases.items():
+        cached_ns = measure(cached, items, args.repeat, args.number)
+        baseline_ns = measure(baseline, items, args.repeat, args.number)
+        results["reads"].append(
+            {
+                "case": name,
+                "cached_ns": round(cached_ns, 1),
+                "decode_ns": round(baseline_ns, 1),
+                "speedup": round(baseline_ns / cached_ns, 2),
+            }
+        )
+    return results
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000,
+                        help="items of every kind (text, digits, int)")
+    parser.add_argument("--number", type=int, default=100,
+                        help="reads of every item per repetition")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="repetitions of every measurement")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="write JSON to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    output = json.dumps(run(args), indent=2)
+
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
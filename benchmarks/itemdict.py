@@ -0,0 +1,106 @@
+# <> with ❤️ by Micha Grandel - hello@michagrandel.eu
+""" Micro-benchmark for ItemDict lookups against a plain dict
+
+Looks up ``str``, ``bytes`` and ``int`` keys in an :class:`ItemDict`, in a plain dict
+with the same keys, and in the ItemDict by wrapping every key in an ``Item`` first,
+which is what every ItemDict lookup did before the normalized-key fast path.
+
+Results are written as JSON to stdout or to ``--output``.
+
+Example:
+    ```
+    python benchmarks/itemdict.py --keys 10000 --output itemdict.json
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from plywoodpirate.collections.item import Item
+from plywoodpirate.collections.mapping import ItemDict
+
+
+def measure(func: Callable, keys: List, repeat: int, number: int) -> float:
+    """
+    Best time in nanoseconds to call ``func`` once per key.
+    """
+    def loop():
+        for key in keys:
+            func(key)
+
+    best = min(timeit.repeat(loop, repeat=repeat, number=number))
+    return best / number / len(keys) * 1e9
+
+
+def run(args: argparse.Namespace) -> Dict:
+    values = {"key-{}".format(i): i for i in range(args.keys)}
+    item_dict = ItemDict(values)
+    plain = dict(values)
+    item_getitem = dict.__getitem__
+
+    keys = {
+        "str": list(values),
+        "bytes": [key.encode() for key in values],
+        "int": list(range(args.keys)),
+    }
+    item_dict.update({i: i for i in keys["int"]})
+    plain.update({i: i for i in keys["int"]})
+    plain.update({key: i for i, key in enumerate(keys["bytes"])})
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "keys": args.keys,
+            "repeat": args.repeat,
+        },
+        "lookups": [],
+    }
+    for kind, lookup_keys in keys.items():
+        cases = {
+            "dict": plain.__getitem__,
+            "ItemDict": item_dict.__getitem__,
+            "ItemDict with Item(key)": lambda key: item_getitem(item_dict, Item(key)),
+            "dict in": plain.__contains__,
+            "ItemDict in": item_dict.__contains__,
+        }
+        for case, func in cases.items():
+            ns = measure(func, lookup_keys, args.repeat, args.number)
+            results["lookups"].append({"key": kind, "case": case, "ns": round(ns, 1)})
+    return results
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=10000,
+                        help="keys of every kind (str, bytes, int)")
+    parser.add_argument("--number", type=int, default=20,
+                        help="lookups of every key per repetition")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="repetitions of every measurement")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="write JSON to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    output = json.dumps(run(args), indent=2)
+
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# <> with ❤️ by Micha Grandel - hello@michagrandel.eu
+""" Benchmark for converting same-shaped records with nestednamedtuple
+
+Converts a list of records that all have the same keys, like rows of parsed JSON,
+with :func:`plywoodpirate.collections.namedtuple.nestednamedtuple`. As baseline, the
+same conversion creates a new namedtuple class for every mapping, which is what
+``nestednamedtuple`` did before generated classes were cached.
+
+Results are written as JSON to stdout or to ``--output``.
+
+Example:
+    ```
+    python benchmarks/namedtuple.py --records 10000 --output namedtuple.json
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections import namedtuple
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from plywoodpirate.collections.namedtuple import fdict, nestednamedtuple
+
+
+def uncached(dictionary):
+    if isinstance(dictionary, Mapping) and not isinstance(dictionary, fdict):
+        for key, value in list(dictionary.items()):
+            dictionary[key] = uncached(value)
+        return namedtuple("namedtupled", dictionary)(**dictionary)
+    elif isinstance(dictionary, list):
+        return [uncached(item) for item in dictionary]
+    return dictionary
+
+
+def make_records(count: int) -> List[dict]:
+    return [
+        {
+            "id": i,
+            "name": "record-{}".format(i),
+            "owner": {"id": i % 100, "name": "owner-{}".format(i % 100)},
+            "tags": ["a", "b"],
+        }
+        for i in range(count)
+    ]
+
+
+def measure(func: Callable, records: int, repeat: int) -> float:
+    """
+    Best time in microseconds to convert one record.
+    """
+    times = []
+    for _ in range(repeat):
+        data = make_records(records)
+        times.append(timeit.timeit(lambda: func(data), number=1))
+    return min(times) / records * 1e6
+
+
+def run(args: argparse.Namespace) -> Dict:
+    cached_us = measure(nestednamedtuple, args.records, args.repeat)
+    uncached_us = measure(uncached, args.records, args.repeat)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "records": args.records,
+            "repeat": args.repeat,
+        },
+        "conversion": {
+            "cached_us_per_record": round(cached_us, 2),
+            "uncached_us_per_record": round(uncached_us, 2),
+            "speedup": round(uncached_us / cached_us, 2),
+        },
+    }
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10000,
+                        help="records converted per repetition")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="repetitions of every measurement")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="write JSON to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    output = json.dumps(run(args), indent=2)
+
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+# <> with ❤️ by Micha Grandel - hello@michagrandel.eu
+""" Loopback benchmark for plywoodpirate.asyncio streams and TLS throughput
+
+Starts a local asyncio server with a self-signed certificate, which is generated at
+runtime with the ``openssl`` command line tool, and upgrades every connection with
+:func:`plywoodpirate.asyncio.streams.tls_handshake`. Everything runs on 127.0.0.1, so
+no network access is required.
+
+Measured are connections per second and handshake latency percentiles, and the
+throughput in MB/s for several message sizes and concurrency levels. Results are
+written as JSON to stdout or to ``--output``.
+
+Example:
+    ```
+    python benchmarks/streams.py --concurrency 1 8 --sizes 1024 65536 \
+        --output before.json
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import ssl
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from plywoodpirate.asyncio import tls_handshake
+
+HOST = "127.0.0.1"
+HEADER = struct.Struct("!Q")
+
+
+def make_certificate(directory: Path) -> Tuple[Path, Path]:
+    """
+    Create a self-signed certificate and key for 127.0.0.1 in ``directory``.
+
+    Args:
+        directory: Directory to write ``server.crt`` and ``server.key`` to.
+
+    Returns:
+        Paths of the certificate and the key.
+    """
+    certfile = directory / "server.crt"
+    keyfile = directory / "server.key"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-days", "1", "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=IP:127.0.0.1,DNS:localhost",
+            "-keyout", str(keyfile), "-out", str(certfile),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+def make_contexts(
+    certfile: Path, keyfile: Path
+) -> Tuple[ssl.SSLContext, ssl.SSLContext]:
+    """
+    Create server and client SSL contexts which trust the self-signed certificate.
+    """
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(certfile=certfile, keyfile=keyfile)
+    client_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    client_context.load_verify_locations(cafile=certfile)
+    return server_context, client_context
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """
+    Summarize latencies in seconds as milliseconds.
+    """
+    values = sorted(values)
+
+    def pick(q: float) -> float:
+        index = min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))
+        return round(values[index] * 1000, 4)
+
+    return {
+        "min": round(values[0] * 1000, 4),
+        "mean": round(statistics.fmean(values) * 1000, 4),
+        "p50": pick(50),
+        "p90": pick(90),
+        "p99": pick(99),
+        "max": round(values[-1] * 1000, 4),
+    }
+
+
+async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, context):
+    """
+    Upgrade the connection and acknowledge each transfer after it was fully received.
+    """
+    try:
+        await tls_handshake(reader, writer, ssl_context=context, server_side=True)
+        while True:
+            header = await reader.read(HEADER.size)
+            if not header:
+                break
+            header += await reader.readexactly(HEADER.size - len(header))
+            remaining = HEADER.unpack(header)[0]
+            while remaining:
+                chunk = await reader.read(min(remaining, 2**20))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+            writer.write(b"\x00")
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError, ssl.SSLError):
+        pass
+    finally:
+        writer.close()
+
+
+async def connect(port: int, context: ssl.SSLContext):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    await tls_handshake(reader, writer, ssl_context=context)
+    return reader, writer
+
+
+async def close(writer: asyncio.StreamWriter):
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, ssl.SSLError):
+        pass
+
+
+async def bench_handshakes(port: int, context, connections: int, concurrency: int):
+    """
+    Open ``connections`` TLS connections with ``concurrency`` clients in parallel.
+    """
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            _, writer = await connect(port, context)
+            latencies.append(time.perf_counter() - start)
+            await close(writer)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "connections": connections,
+        "connections_per_second": round(connections / elapsed, 2),
+        "handshake_ms": percentiles(latencies),
+    }
+
+
+async def bench_throughput(port: int, context, size: int, total: int, concurrency: int):
+    """
+    Send ``total`` bytes in messages of ``size`` bytes over each of ``concurrency``
+    connections and wait for the server to acknowledge them.
+    """
+    message = os.urandom(size)
+    count = max(1, total // size)
+    streams = await asyncio.gather(
+        *(connect(port, context) for _ in range(concurrency))
+    )
+
+    async def transfer(reader, writer):
+        writer.write(HEADER.pack(count * size))
+        for _ in range(count):
+            writer.write(message)
+            await writer.drain()
+        await reader.readexactly(1)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(transfer(reader, writer) for reader, writer in streams))
+    elapsed = time.perf_counter() - start
+
+    await asyncio.gather(*(close(writer) for _, writer in streams))
+
+    transferred = count * size * concurrency
+    return {
+        "concurrency": concurrency,
+        "message_size": size,
+        "bytes": transferred,
+        "seconds": round(elapsed, 6),
+        "mb_per_second": round(transferred / elapsed / 1e6, 2),
+    }
+
+
+async def run(args: argparse.Namespace, server_context, client_context) -> dict:
+    server = await asyncio.start_server(
+        lambda r, w: serve(r, w, server_context), host=HOST, port=0
+    )
+    port = server.sockets[0].getsockname()[1]
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "openssl": ssl.OPENSSL_VERSION,
+            "repeat": args.repeat,
+        },
+        "handshake": [],
+        "throughput": [],
+    }
+
+    async with server:
+        for concurrency in args.concurrency:
+            for _ in range(args.repeat):
+                results["handshake"].append(
+                    await bench_handshakes(
+                        port, client_context, args.connections, concurrency
+                    )
+                )
+            for size in args.sizes:
+                for _ in range(args.repeat):
+                    results["throughput"].append(
+                        await bench_throughput(
+                            port, client_context, size, args.total, concurrency
+                        )
+                    )
+
+    return results
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=200,
+                        help="connections per handshake run")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32],
+                        help="concurrent clients")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1024, 16384, 262144],
+                        help="message sizes in bytes")
+    parser.add_argument("--total", type=int, default=2**24,
+                        help="bytes sent per connection in throughput runs")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="repetitions of every measurement")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="write JSON to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    # StreamReaderProtocol keeps the transport open on EOF, which asyncio reports for
+    # every connection upgraded with start_tls().
+    logging.getLogger("asyncio").setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as directory:
+        certificate = make_certificate(Path(directory))
+        server_context, client_context = make_contexts(*certificate)
+
+    results = asyncio.run(run(args, server_context, client_context))
+    output = json.dumps(results, indent=2)
+
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
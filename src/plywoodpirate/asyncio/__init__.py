@@ -3,10 +3,18 @@ __all__ = [
     'CoroutineClass', 
     'tls_handshake', 
     'to_thread', 
-    'awaitable'
+    'awaitable',
+    'CompressedStreamReader',
+    'CompressedStreamWriter',
+    'compress_streams'
 ]
 
 from .cache import future_lru_cache
 from .pattern import CoroutineClass
 from .streams import tls_handshake
 from .threads import to_thread, awaitable
+from .compression import (
+    CompressedStreamReader,
+    CompressedStreamWriter,
+    compress_streams,
+)
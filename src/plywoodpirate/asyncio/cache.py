@@ -2,6 +2,20 @@ import asyncio
 from functools import _make_key, wraps
 from typing import Awaitable, Optional
 
+from ..functools.deadline import DeadlineExceeded, deadline
+
+
+async def _wait_until_deadline(future: asyncio.Future, remaining: float):
+    """
+    Wait for a shared ``future`` without cancelling it for the other waiters.
+    """
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), remaining)
+    except asyncio.TimeoutError as err:
+        raise DeadlineExceeded(
+            "Deadline passed while waiting for a cached call."
+        ) from err
+
 
 def future_lru_cache(maxsize: Optional[int] = None) -> Awaitable:
     """
@@ -14,6 +28,12 @@ def future_lru_cache(maxsize: Optional[int] = None) -> Awaitable:
         The decorated function.
 
     Notes:
+        Callers inside a :class:`plywoodpirate.functools.deadline.deadline` fail with
+        :class:`plywoodpirate.functools.deadline.DeadlineExceeded` once it passed,
+        instead of starting the call or waiting for a call in progress. The call
+        itself keeps running for the other waiters, also when the caller that
+        started it gives up.
+
         This method is a modification of a answer from StackOverflow
         `here <https://stackoverflow.com/a/37627076/1305461>`_.
 
@@ -48,20 +68,35 @@ def future_lru_cache(maxsize: Optional[int] = None) -> Awaitable:
         @wraps(func)
         def decorator(*args, **kwargs):
             key = _make_key(args, kwargs, False)
+            remaining = deadline.remaining()
             if key in cache:
                 # Some protection against duplicating calls already in
                 # progress: when starting the call cache the future, and if
                 # the same thing is requested again return that future.
                 if isinstance(cache[key], asyncio.Future):
-                    return cache[key]
+                    if remaining is None or cache[key].done():
+                        return cache[key]
+                    if remaining <= 0:
+                        f = asyncio.Future()
+                        f.set_exception(DeadlineExceeded("Deadline has passed."))
+                        return f
+                    return asyncio.ensure_future(
+                        _wait_until_deadline(cache[key], remaining)
+                    )
                 else:
                     f = asyncio.Future()
                     f.set_result(cache[key])
                     return f
+            elif remaining is not None and remaining <= 0:
+                f = asyncio.Future()
+                f.set_exception(DeadlineExceeded("Deadline has passed."))
+                return f
             else:
                 task = asyncio.Task(run_and_cache(func, args, kwargs))
                 cache[key] = task
-                return task
+                if remaining is None:
+                    return task
+                return asyncio.ensure_future(_wait_until_deadline(task, remaining))
 
         return decorator
 
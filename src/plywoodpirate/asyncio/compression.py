@@ -0,0 +1,373 @@
+import asyncio
+import lzma
+import zlib
+from typing import Optional, Tuple
+
+from .threads import to_thread
+
+ALGORITHMS = ("zlib", "gzip", "lzma")
+DEFAULT_LIMIT = 2**16
+DEFAULT_OFFLOAD = 2**16
+
+
+class _Encoder:
+    """
+    Incremental compressor with a common interface for all supported algorithms.
+    """
+
+    def __init__(self, algorithm: str, level: Optional[int] = None):
+        if algorithm == "lzma":
+            preset = 6 if level is None else level
+            self._obj = lzma.LZMACompressor(format=lzma.FORMAT_XZ, preset=preset)
+        else:
+            wbits = 31 if algorithm == "gzip" else 15
+            level = zlib.Z_DEFAULT_COMPRESSION if level is None else level
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, wbits)
+        self._algorithm = algorithm
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def sync(self) -> bytes:
+        """
+        Emit all pending output so the peer can decompress everything written so far.
+        """
+        if self._algorithm == "lzma":
+            # LZMACompressor cannot flush without ending the stream.
+            return b""
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _Decoder:
+    """
+    Incremental decompressor that never produces more than ``max_length`` bytes at once.
+    """
+
+    def __init__(self, algorithm: str):
+        if algorithm == "lzma":
+            self._obj = lzma.LZMADecompressor(format=lzma.FORMAT_XZ)
+        else:
+            self._obj = zlib.decompressobj(31 if algorithm == "gzip" else 15)
+        self._zlib = algorithm != "lzma"
+
+    @property
+    def needs_input(self) -> bool:
+        if self._zlib:
+            return not self._obj.unconsumed_tail
+        return self._obj.needs_input
+
+    @property
+    def eof(self) -> bool:
+        return self._obj.eof
+
+    def decompress(self, data: bytes, max_length: int) -> bytes:
+        if self._zlib:
+            data = self._obj.unconsumed_tail + data
+        return self._obj.decompress(data, max_length)
+
+
+def _check_algorithm(algorithm: str):
+    if algorithm not in ALGORITHMS:
+        err = "Passed 'algorithm' is not one of {}.".format(", ".join(ALGORITHMS))
+        raise ValueError(err)
+
+
+class CompressedStreamReader:
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        algorithm: str = "zlib",
+        limit: int = DEFAULT_LIMIT,
+        offload: Optional[int] = DEFAULT_OFFLOAD,
+    ):
+        """
+        Decompresses data from a :class:`asyncio.StreamReader` incrementally.
+
+        At most ``limit`` bytes of compressed input are read from the underlying
+        stream at once, and the buffer is only refilled with at most ``limit``
+        decompressed bytes when a read needs more data, which protects against
+        decompression bombs.
+
+        Args:
+            reader: The reader of the connection.
+            algorithm: One of ``"zlib"``, ``"gzip"`` or ``"lzma"``.
+            limit: Size of the internal buffers in bytes.
+            offload: Compressed chunks of at least this many bytes are decompressed
+                with :func:`plywoodpirate.asyncio.threads.to_thread`. ``None`` never
+                offloads.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.asyncio.compression import CompressedStreamReader
+                import asyncio
+
+                async def client():
+                    reader, writer = await asyncio.open_connection("127.0.0.1", 8888)
+                    creader = CompressedStreamReader(reader, algorithm="gzip")
+                    data = await creader.read()
+        """
+        _check_algorithm(algorithm)
+        self._reader = reader
+        self._decoder = _Decoder(algorithm)
+        self._buffer = bytearray()
+        self._limit = limit
+        self._offload = offload
+
+    @property
+    def reader(self) -> asyncio.StreamReader:
+        """
+        The wrapped reader.
+        """
+        return self._reader
+
+    def at_eof(self) -> bool:
+        """
+        Whether the compressed stream ended and the buffer is empty.
+        """
+        if self._buffer:
+            return False
+        # The decoder may still hold input although the reader is exhausted.
+        return self._decoder.eof or (
+            self._reader.at_eof() and self._decoder.needs_input
+        )
+
+    async def _decompress(self, data: bytes) -> bytes:
+        if self._offload is not None and len(data) >= self._offload:
+            return await to_thread(self._decoder.decompress, data, self._limit)
+        return self._decoder.decompress(data, self._limit)
+
+    async def _fill(self) -> bool:
+        """
+        Decompress more data into the buffer. Returns False once nothing is left.
+
+        Raises:
+            asyncio.IncompleteReadError: If the underlying stream ends before the end
+                of the compressed stream, e.g. when the peer's output was truncated.
+        """
+        if self._decoder.eof:
+            return False
+
+        data = b""
+        if self._decoder.needs_input:
+            data = await self._reader.read(self._limit)
+            if not data:
+                raise asyncio.IncompleteReadError(b"", None)
+
+        self._buffer += await self._decompress(data)
+        return True
+
+    async def read(self, n: int = -1) -> bytes:
+        """
+        Read up to ``n`` decompressed bytes. Reads until EOF if ``n`` is negative.
+
+        Raises:
+            asyncio.IncompleteReadError: If the compressed stream is truncated. Its
+                ``partial`` holds the data decompressed before.
+        """
+        if n == 0:
+            return b""
+
+        if n < 0:
+            chunks = []
+            while True:
+                try:
+                    chunk = await self.read(self._limit)
+                except asyncio.IncompleteReadError as exc:
+                    chunks.append(exc.partial)
+                    raise asyncio.IncompleteReadError(b"".join(chunks), None) from None
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+
+        while not self._buffer:
+            if not await self._fill():
+                break
+
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+    async def readexactly(self, n: int) -> bytes:
+        """
+        Read exactly ``n`` decompressed bytes.
+
+        Raises:
+            asyncio.IncompleteReadError: If the stream ends before ``n`` bytes are read,
+                or if the compressed stream is truncated.
+        """
+        while len(self._buffer) < n:
+            try:
+                filled = await self._fill()
+            except asyncio.IncompleteReadError:
+                filled = False
+            if not filled:
+                partial = bytes(self._buffer)
+                self._buffer.clear()
+                raise asyncio.IncompleteReadError(partial, n)
+
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+
+class CompressedStreamWriter:
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        algorithm: str = "zlib",
+        level: Optional[int] = None,
+        limit: int = DEFAULT_LIMIT,
+        offload: Optional[int] = DEFAULT_OFFLOAD,
+    ):
+        """
+        Compresses data written to a :class:`asyncio.StreamWriter` incrementally.
+
+        Unlike :meth:`asyncio.StreamWriter.write`, :meth:`write` is a coroutine, since
+        large chunks are compressed in a separate thread. Input is split into chunks
+        of at most ``limit`` bytes, so the compressor never holds more than that at
+        once.
+
+        Args:
+            writer: The writer of the connection.
+            algorithm: One of ``"zlib"``, ``"gzip"`` or ``"lzma"``.
+            level: Compression level (or preset for ``lzma``). Defaults to the
+                algorithm's default.
+            limit: Size of the chunks passed to the compressor in bytes.
+            offload: Chunks of at least this many bytes are compressed with
+                :func:`plywoodpirate.asyncio.threads.to_thread`. ``None`` never
+                offloads.
+
+        Note:
+            ``lzma`` cannot flush without ending the stream, so data written with it is
+            only guaranteed to reach the peer after :meth:`write_eof` or :meth:`close`.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.asyncio.compression import CompressedStreamWriter
+                import asyncio
+
+                async def server(reader, writer):
+                    cwriter = CompressedStreamWriter(writer, algorithm="gzip", level=6)
+                    await cwriter.write(b"hello world" * 1000)
+                    await cwriter.close()
+        """
+        _check_algorithm(algorithm)
+        self._writer = writer
+        self._encoder = _Encoder(algorithm, level)
+        self._limit = limit
+        self._offload = offload
+        self._lock = asyncio.Lock()
+        self._finished = False
+
+    @property
+    def writer(self) -> asyncio.StreamWriter:
+        """
+        The wrapped writer.
+        """
+        return self._writer
+
+    async def _compress(self, data: bytes) -> bytes:
+        if self._offload is not None and len(data) >= self._offload:
+            return await to_thread(self._encoder.compress, data)
+        return self._encoder.compress(data)
+
+    async def write(self, data: bytes, flush: bool = False):
+        """
+        Compress ``data`` and write it to the underlying stream.
+
+        Args:
+            data: Data to compress.
+            flush: Whether to flush the compressor so the peer can read ``data``
+                without waiting for more input.
+        """
+        if self._finished:
+            raise RuntimeError("Cannot write to a finished compressed stream.")
+
+        async with self._lock:
+            view = memoryview(data)
+            for start in range(0, len(view), self._limit):
+                chunk = await self._compress(view[start : start + self._limit])
+                if chunk:
+                    self._writer.write(chunk)
+                    await self._writer.drain()
+
+            if flush:
+                self._writer.write(self._encoder.sync())
+                await self._writer.drain()
+
+    async def flush(self):
+        """
+        Flush the compressor, so everything written so far can be read by the peer.
+        """
+        await self.write(b"", flush=True)
+
+    async def write_eof(self):
+        """
+        End the compressed stream without closing the connection.
+        """
+        async with self._lock:
+            if not self._finished:
+                self._finished = True
+                self._writer.write(self._encoder.finish())
+                await self._writer.drain()
+
+    async def close(self):
+        """
+        End the compressed stream and close the underlying writer.
+        """
+        await self.write_eof()
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+def compress_streams(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    algorithm: str = "zlib",
+    level: Optional[int] = None,
+    limit: int = DEFAULT_LIMIT,
+    offload: Optional[int] = DEFAULT_OFFLOAD,
+) -> Tuple[CompressedStreamReader, CompressedStreamWriter]:
+    """
+    Wrap both sides of a connection with compression.
+
+    The wrappers hold on to the passed reader and writer, so they can be created before
+    or after upgrading the connection with
+    :func:`plywoodpirate.asyncio.streams.tls_handshake`.
+
+    Args:
+        reader: The reader of the connection.
+        writer: The writer of the connection.
+        algorithm: One of ``"zlib"``, ``"gzip"`` or ``"lzma"``.
+        level: Compression level of the writer.
+        limit: Size of the internal buffers in bytes.
+        offload: Chunks of at least this many bytes are (de)compressed in a thread.
+
+    Example:
+
+        .. code-block:: python
+
+            from plywoodpirate.asyncio import compress_streams, tls_handshake
+            import asyncio
+
+            async def client():
+                reader, writer = await asyncio.open_connection(
+                    "example.com", 443, ssl=False
+                )
+                await tls_handshake(reader=reader, writer=writer)
+                creader, cwriter = compress_streams(reader, writer, algorithm="gzip")
+
+                await cwriter.write(b"hello world", flush=True)
+                data = await creader.read(1024)
+    """
+    return (
+        CompressedStreamReader(reader, algorithm, limit=limit, offload=offload),
+        CompressedStreamWriter(writer, algorithm, level, limit=limit, offload=offload),
+    )
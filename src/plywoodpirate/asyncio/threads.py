@@ -3,6 +3,16 @@ import contextvars
 import functools
 from typing import Any, Awaitable, Callable
 
+from ..functools.deadline import DeadlineExceeded, deadline
+
+
+def _run_before_deadline(func: Callable, *args, **kwargs) -> Any:
+    """
+    Skip ``func`` if the deadline passed while it was waiting for a worker thread.
+    """
+    deadline.check()
+    return func(*args, **kwargs)
+
 
 async def to_thread(func: Callable, *args, **kwargs) -> Awaitable:
     """Asynchronously run function ``func`` in a separate thread.
@@ -12,6 +22,11 @@ async def to_thread(func: Callable, *args, **kwargs) -> Awaitable:
     allowing context variables from the main thread to be accessed in the
     separate thread.
 
+    A :class:`plywoodpirate.functools.deadline.deadline` of the current context is
+    honored: ``func`` is not started once the deadline has passed, and the caller
+    stops waiting for the result when it passes, raising
+    :class:`plywoodpirate.functools.deadline.DeadlineExceeded`.
+
     Return a coroutine that can be awaited to get the eventual result of *func*.
 
     Args:
@@ -42,10 +57,25 @@ async def to_thread(func: Callable, *args, **kwargs) -> Awaitable:
             asyncio.run(main())
     """
 
+    deadline.check()
+
     loop = asyncio.get_event_loop()
     ctx = contextvars.copy_context()
-    func_call = functools.partial(ctx.run, func, *args, **kwargs)
-    return await loop.run_in_executor(None, func_call)
+    func_call = functools.partial(ctx.run, _run_before_deadline, func, *args, **kwargs)
+    future = loop.run_in_executor(None, func_call)
+
+    remaining = deadline.remaining()
+    if remaining is None:
+        return await future
+
+    try:
+        return await asyncio.wait_for(future, remaining)
+    except asyncio.TimeoutError as err:
+        raise DeadlineExceeded(
+            "Deadline passed while waiting for {}.".format(
+                getattr(func, "__name__", repr(func))
+            )
+        ) from err
 
 
 def awaitable(func: Callable) -> Awaitable[Any]:
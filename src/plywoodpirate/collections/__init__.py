@@ -2,6 +2,9 @@
 
 __all__ = [
     'Item',
+    'ItemBuffer',
+    'ItemPool',
+    'ItemArray',
     'nestednamedtuple',
     'fdict',
     'BaseDict',
@@ -14,7 +17,8 @@ __all__ = [
     'UnderscoreAccessDict'
 ]
 
-from .item import Item
+from .item import Item, ItemBuffer, ItemPool
+from .itemarray import ItemArray
 from .namedtuple import nestednamedtuple, fdict
 from .mapping import (
     BaseDict, 
@@ -1,11 +1,18 @@
-from typing import Union, Iterator
+import collections
+import mmap
+import threading
+import weakref
+from typing import Iterator, Optional, Union
 
 ENCODE = "ascii"
-ItemType = Union[bytes, str, int, bool, None, "Item"]
+ItemType = Union[bytes, bytearray, memoryview, mmap.mmap, str, int, bool, None, "Item"]
+
+# Marks derived representations that are not computed yet.
+_UNSET = object()
 
 
 class Item:
-    __slots__ = ["_item", "_type"]
+    __slots__ = ["_item", "_type", "_string", "_integer", "_shared", "__weakref__"]
 
     def __init__(self, item: ItemType):
         """
@@ -17,6 +24,21 @@ class Item:
         done to the internal ``bytes`` object. The true usefulness of this container is
         for type-agnostic operations such as equality checks.
 
+        The ``str`` and ``int`` representations are decoded on first access and cached
+        until the item is modified.
+
+        ``bytearray``, ``memoryview`` and ``mmap`` inputs are not copied: the item keeps
+        a read-only ``memoryview`` of them, e.g. of a reusable socket buffer. Equality
+        checks, ``len()`` and ``view`` work on the view directly. ``raw``, ``string``,
+        ``integer``, hashing and modifications copy the content to ``bytes`` once and
+        detach the item from the buffer, so cached representations never go stale.
+        Until then the buffer must not change, and the view pins its size: resizing a
+        ``bytearray`` raises ``BufferError``.
+
+        :meth:`intern` returns a shared, canonical item for repeated values to save
+        memory. ``+=`` and ``-=`` on a shared item return a new item instead of
+        modifying it in place.
+
         Args:
             item: Input to be stored.
 
@@ -38,20 +60,46 @@ class Item:
         """
         self._type = type(item)
         self._item = self.byte_item(item=item)
+        self._string = self._integer = _UNSET
+        self._shared = False
+
+    @staticmethod
+    def intern(item: ItemType) -> "Item":
+        """
+        Shared, canonical item equal to ``item`` from the default :class:`ItemPool`.
+
+        The default pool holds weak references, so items are dropped once they are
+        not used anymore.
+        """
+        return _pool.intern(item)
 
     @property
     def raw(self) -> bytes:
         """
         Bytes representation of the passed item.
         """
-        return self._item
+        item = self._item
+        if type(item) is memoryview:
+            item = self._item = item.tobytes()
+        return item
+
+    @property
+    def view(self) -> memoryview:
+        """
+        Read-only ``memoryview`` of the passed item, without copying it.
+        """
+        return memoryview(self._item)
 
     @property
     def string(self) -> str:
         """
         String representation of the passed item.
         """
-        return self._item.decode(ENCODE)
+        string = self._string
+        if string is _UNSET:
+            # raw detaches view-backed items, so the cache can't go stale.
+            string = self._string = str(self.raw, ENCODE)
+        return string
 
     @property
     def integer(self) -> Union[int, None]:
@@ -61,10 +109,15 @@ class Item:
         If passed item is not a sub class of type int or str.isdigit() this property
         returns None.
         """
-        if issubclass(self._type, int) or self.string.isdigit():
-            return int(self._item)
-        else:
-            return None
+        integer = self._integer
+        if integer is _UNSET:
+            raw = self.raw
+            if issubclass(self._type, int) or raw.isdigit():
+                integer = int(raw)
+            else:
+                integer = None
+            self._integer = integer
+        return integer
 
     @property
     def boolean(self) -> bool:
@@ -72,7 +125,7 @@ class Item:
         Boolean representation of the passed item.
         """
         if issubclass(self._type, int):
-            return bool(int(self._item))
+            return bool(self.integer)
         else:
             return bool(self._item)
 
@@ -81,12 +134,16 @@ class Item:
         """
         Original representation of the passed item.
         """
-        if self._type is str and isinstance(self._item, bytes):
-            return self._item.decode(ENCODE)
+        if self._type is str:
+            return self.string
+        elif self._type is int:
+            return self.integer
         elif self._type is type(None):
             return None
+        elif issubclass(self._type, (memoryview, mmap.mmap)):
+            return self.view
 
-        return self._type(self._item)
+        return self._type(self.raw)
 
     def replace(self, old: ItemType, new: ItemType, count: int = -1) -> bytes:
         """
@@ -130,36 +187,46 @@ class Item:
 
     def __contains__(self, item: ItemType) -> bool:
         _item = self.byte_item(item=item)
-        return _item in self._item
+        return _item in self.raw
 
     def __eq__(self, item: ItemType) -> bool:
+        if item is self:
+            return True
+        if type(item) is bytes:
+            return self._item == item
         _item = self.byte_item(item=item)
         return self._item == _item
 
     def __add__(self, item: ItemType) -> "Item":
         _item = self.byte_item(item=item)
-        return Item(self._item + _item)
+        return Item(self.raw + _item)
 
     def __iadd__(self, item: ItemType) -> "Item":
-        self._item = (self + Item(item))._item
+        if self._shared:
+            return self + item
+        self._item = self.raw + self.byte_item(item=item)
+        self._string = self._integer = _UNSET
         return self
 
     def __sub__(self, item: ItemType) -> "Item":
         _item = self.byte_item(item=item)
-        return Item(self._item.replace(_item, b""))
+        return Item(self.raw.replace(_item, b""))
 
     def __isub__(self, item: ItemType) -> "Item":
-        self._item = (self - Item(item))._item
+        if self._shared:
+            return self - item
+        self._item = self.raw.replace(self.byte_item(item=item), b"")
+        self._string = self._integer = _UNSET
         return self
 
     def __iter__(self) -> Iterator[str]:
         return iter(self.string)
 
     def __hash__(self) -> int:
-        return hash(self._item)
+        return hash(self.raw)
 
     def __len__(self) -> int:
-        return len(self.raw)
+        return len(self._item)
 
     def __bool__(self) -> bool:
         return self.boolean
@@ -176,21 +243,255 @@ class Item:
         Converts passed item into its bytes representation, and returns an Item instance.
 
         Args:
-            item: Item of str, bytes, int, bool, None, or Item to convert to an Item.
+            item: Item of str, bytes, int, bool, None, Item or ItemBuffer to convert.
+                ``bytearray``, ``memoryview`` and ``mmap`` objects are converted to a
+                read-only ``memoryview`` without copying.
         """
 
         if isinstance(item, str):
             _item = item.encode(ENCODE)
         elif isinstance(item, bytes):
             _item = item
+        elif isinstance(item, (bytearray, memoryview, mmap.mmap)):
+            _item = memoryview(item)
+            if _item.format != "B" or _item.ndim != 1:
+                _item = _item.cast("B")
+            _item = _item.toreadonly()
         elif isinstance(item, int):
             _item = b"%d" % item
         elif item is None:
             _item = b""
         elif isinstance(item, Item):
+            _item = item._item
+        elif isinstance(item, ItemBuffer):
             _item = item.raw
         else:
-            err = "Passed 'item' is not of type str, bytes, int, None, or Item."
+            err = (
+                "Passed 'item' is not of type str, bytes, bytes-like, int, None, Item "
+                "or ItemBuffer."
+            )
             raise TypeError(err)
 
         return _item
+
+
+class ItemPool:
+    def __init__(self, maxsize: Optional[int] = None):
+        """
+        Pool of canonical :class:`Item` instances to deduplicate repeated values.
+
+        :meth:`intern` returns the same item for equal content and original type, so
+        records with the same keys and values over and over share their items, and
+        equality checks between them short-circuit on identity.
+
+        Without ``maxsize`` the pool holds weak references and an item is dropped
+        once nothing else uses it. With ``maxsize`` it keeps up to ``maxsize`` least
+        recently used items alive.
+
+        Args:
+            maxsize: Maximum number of items to keep. None holds weak references.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.collections.item import ItemPool
+                from plywoodpirate.collections.mapping import ItemDict
+
+                pool = ItemPool(maxsize=10000)
+                records = [
+                    ItemDict({pool.intern(k): pool.intern(v) for k, v in row.items()})
+                    for row in rows
+                ]
+
+                # ItemDict stores the interned items as they are.
+                print(records[0]["status"] is records[1]["status"])  # >>> True
+        """
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        if maxsize is None:
+            self._items = weakref.WeakValueDictionary()
+        else:
+            self._items = collections.OrderedDict()
+
+    def intern(self, item: ItemType) -> Item:
+        """
+        Canonical item equal to ``item``, adding it to the pool if it is new.
+        """
+        if isinstance(item, Item):
+            kind = item._type
+            raw = item.raw
+        else:
+            kind = type(item)
+            raw = Item.byte_item(item=item)
+            if type(raw) is memoryview:
+                raw = raw.tobytes()
+        key = (raw, kind)
+
+        with self._lock:
+            canonical = self._items.get(key)
+            if canonical is not None:
+                if self.maxsize is not None:
+                    self._items.move_to_end(key)
+                return canonical
+
+            if isinstance(item, Item) and item._shared:
+                canonical = item
+            else:
+                canonical = Item(raw)
+                canonical._type = kind
+                canonical._shared = True
+
+            self._items[key] = canonical
+            if self.maxsize is not None and len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+            return canonical
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_pool = ItemPool()
+
+
+class ItemBuffer:
+    __slots__ = ["_buffer"]
+
+    def __init__(self, item: ItemType = None):
+        """
+        Mutable, ``bytearray`` backed counterpart of :class:`Item`.
+
+        Accepts and compares with the same ``str``, ``bytes``, ``int``, ``bool``,
+        ``None`` and ``Item`` values as :class:`Item`, but edits the internal
+        ``bytearray`` in place: appending is amortized O(1) and replacing or removing
+        happens in a single pass, so assembling payloads in a loop stays linear.
+
+        :meth:`view` exports the content as ``memoryview`` without copying. The buffer
+        cannot change size while a view is held, so release it before editing.
+
+        Args:
+            item: Initial content.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.collections.item import ItemBuffer
+
+                message = ItemBuffer("HELLO ")
+                for value in (1, "two", b"three"):
+                    message += value
+                    message += ";"
+                message -= ";"
+
+                print(message.string)  # >>> HELLO 1twothree
+
+                with message.view() as view:
+                    sock.sendall(view)
+        """
+        self._buffer = bytearray(Item.byte_item(item=item))
+
+    @property
+    def raw(self) -> bytes:
+        """
+        Bytes copy of the buffer.
+        """
+        return bytes(self._buffer)
+
+    @property
+    def string(self) -> str:
+        """
+        String representation of the buffer.
+        """
+        return self._buffer.decode(ENCODE)
+
+    @property
+    def integer(self) -> Union[int, None]:
+        """
+        Integer representation of the buffer, or None if it is not a number.
+        """
+        if self._buffer.isdigit():
+            return int(self._buffer)
+        return None
+
+    def view(self) -> memoryview:
+        """
+        Zero-copy ``memoryview`` of the buffer.
+        """
+        return memoryview(self._buffer)
+
+    def append(self, item: ItemType):
+        """
+        Append ``item`` to the end of the buffer.
+        """
+        self._buffer += Item.byte_item(item=item)
+
+    def replace(self, old: ItemType, new: ItemType, count: int = -1):
+        """
+        ``bytes.replace()`` functionality, editing the buffer in place.
+        """
+        old = Item.byte_item(item=old)
+        if old in self._buffer:
+            new = Item.byte_item(item=new)
+            self._buffer[:] = self._buffer.replace(old, new, count)
+
+    def remove(self, item: ItemType, count: int = -1):
+        """
+        Remove occurrences of ``item`` in place.
+        """
+        self.replace(item, b"", count)
+
+    def clear(self):
+        del self._buffer[:]
+
+    def to_item(self) -> Item:
+        """
+        Immutable :class:`Item` of the current content.
+        """
+        return Item(self.raw)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, bytes]:
+        if isinstance(key, slice):
+            return bytes(self._buffer[key])
+        return self._buffer[key]
+
+    def __setitem__(self, key: slice, item: ItemType):
+        self._buffer[key] = Item.byte_item(item=item)
+
+    def __delitem__(self, key: Union[int, slice]):
+        del self._buffer[key]
+
+    def __contains__(self, item: ItemType) -> bool:
+        return Item.byte_item(item=item) in self._buffer
+
+    def __eq__(self, item: ItemType) -> bool:
+        return self._buffer == Item.byte_item(item=item)
+
+    def __iadd__(self, item: ItemType) -> "ItemBuffer":
+        self.append(item)
+        return self
+
+    def __isub__(self, item: ItemType) -> "ItemBuffer":
+        self.remove(item)
+        return self
+
+    __hash__ = None
+
+    def __bytes__(self) -> bytes:
+        return self.raw
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __bool__(self) -> bool:
+        return bool(self._buffer)
+
+    def __str__(self) -> str:
+        return self.string
+
+    def __repr__(self) -> str:
+        return "ItemBuffer({!r})".format(self.raw)
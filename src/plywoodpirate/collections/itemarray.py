@@ -0,0 +1,194 @@
+import array
+import bisect
+from typing import Callable, Iterable, Iterator, List, Union
+
+from .item import Item, ItemType
+
+# Type tags to restore the original type of the stored items.
+_TYPES = (bytes, str, int, bool, type(None), bytearray)
+_TAGS = {t: tag for tag, t in enumerate(_TYPES)}
+
+
+class ItemArray:
+    __slots__ = ["_blob", "_offsets", "_tags"]
+
+    def __init__(self, items: Iterable[ItemType] = ()):
+        """
+        Compact, columnar sequence of :class:`Item` values.
+
+        All items are stored back to back in one ``bytearray``, with an ``array('q')``
+        of offsets and an ``array('b')`` of type tags, instead of one Python object per
+        item. Searches like :meth:`indices`, :meth:`search` and ``in`` scan the whole
+        blob in C and only touch the items that match.
+
+        Indexing and iterating return :class:`Item` instances with their original type.
+
+        Args:
+            items: Items of str, bytes, int, bool, None, Item or bytes-like objects.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.collections.itemarray import ItemArray
+
+                levels = ItemArray(["info", "error", "info", 500, b"warning"])
+
+                print(levels.indices("info"))  # >>> [0, 2]
+                print(levels.search("rr"))  # >>> [1]
+                print(500 in levels, levels[3].original)  # >>> True 500
+
+                errors = levels.take(levels.search("rr"))
+        """
+        self._blob = bytearray()
+        self._offsets = array.array("q", [0])
+        self._tags = array.array("b")
+        self.extend(items)
+
+    def append(self, item: ItemType):
+        """
+        Append ``item`` to the end of the array.
+        """
+        if isinstance(item, Item):
+            kind = item._type
+        else:
+            kind = type(item)
+        self._blob += Item.byte_item(item=item)
+        self._offsets.append(len(self._blob))
+        self._tags.append(_TAGS.get(kind, 0))
+
+    def extend(self, items: Iterable[ItemType]):
+        """
+        Append all ``items`` to the end of the array.
+        """
+        if isinstance(items, ItemArray):
+            base = len(self._blob)
+            self._blob += items._blob
+            self._offsets.extend(base + offset for offset in items._offsets[1:])
+            self._tags.extend(items._tags)
+            return
+
+        for item in items:
+            self.append(item)
+
+    def raw(self, index: int) -> bytes:
+        """
+        Bytes of the item at ``index``, without creating an :class:`Item`.
+        """
+        index = range(len(self))[index]
+        return bytes(self._blob[self._offsets[index]:self._offsets[index + 1]])
+
+    def indices(self, item: ItemType) -> List[int]:
+        """
+        Indices of all items equal to ``item``.
+        """
+        value = Item.byte_item(item=item)
+        offsets = self._offsets
+        size = len(value)
+
+        if not size:
+            return [i for i in range(len(self)) if offsets[i] == offsets[i + 1]]
+
+        found = []
+        blob = self._blob
+        position = blob.find(value)
+        while position != -1:
+            index = bisect.bisect_right(offsets, position) - 1
+            end = offsets[index + 1]
+            if offsets[index] == position and end - position == size:
+                found.append(index)
+            position = blob.find(value, end)
+        return found
+
+    def search(self, item: ItemType) -> List[int]:
+        """
+        Indices of all items that contain ``item``.
+        """
+        value = Item.byte_item(item=item)
+        offsets = self._offsets
+        size = len(value)
+
+        if not size:
+            return list(range(len(self)))
+
+        found = []
+        blob = self._blob
+        position = blob.find(value)
+        while position != -1:
+            index = bisect.bisect_right(offsets, position) - 1
+            end = offsets[index + 1]
+            if position + size <= end:
+                found.append(index)
+                position = blob.find(value, end)
+            else:
+                position = blob.find(value, position + 1)
+        return found
+
+    def count(self, item: ItemType) -> int:
+        """
+        Number of items equal to ``item``.
+        """
+        return len(self.indices(item))
+
+    def index(self, item: ItemType) -> int:
+        """
+        Index of the first item equal to ``item``.
+
+        Raises:
+            ValueError: If no item is equal to ``item``.
+        """
+        found = self.indices(item)
+        if not found:
+            raise ValueError("{!r} is not in ItemArray.".format(item))
+        return found[0]
+
+    def take(self, indices: Iterable[int]) -> "ItemArray":
+        """
+        New array of the items at ``indices``.
+        """
+        result = ItemArray()
+        blob, offsets, tags = self._blob, self._offsets, self._tags
+        for index in indices:
+            result._blob += blob[offsets[index]:offsets[index + 1]]
+            result._offsets.append(len(result._blob))
+            result._tags.append(tags[index])
+        return result
+
+    def filter(self, predicate: Callable[[Item], bool]) -> "ItemArray":
+        """
+        New array of the items for which ``predicate`` returns True.
+
+        This calls ``predicate`` with an :class:`Item` per element, prefer
+        :meth:`indices` and :meth:`search` with :meth:`take` for large arrays.
+        """
+        return self.take(i for i, item in enumerate(self) if predicate(item))
+
+    def _item(self, index: int) -> Item:
+        item = Item(bytes(self._blob[self._offsets[index]:self._offsets[index + 1]]))
+        item._type = _TYPES[self._tags[index]]
+        return item
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Item, "ItemArray"]:
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        return self._item(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[Item]:
+        for index in range(len(self)):
+            yield self._item(index)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __contains__(self, item: ItemType) -> bool:
+        return bool(self.indices(item))
+
+    def __eq__(self, other: "ItemArray") -> bool:
+        if not isinstance(other, ItemArray):
+            return NotImplemented
+        return self._offsets == other._offsets and self._blob == other._blob
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return "ItemArray([{}])".format(", ".join(repr(item) for item in self))
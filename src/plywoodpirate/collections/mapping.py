@@ -1,6 +1,13 @@
-from typing import Any, Optional
+import array
+import configparser
+import os
+import types
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
 
-from .item import Item, ItemType
+from .item import ENCODE, Item, ItemType
+
+# Marks arguments that are not passed.
+_MISSING = object()
 
 
 class BaseDict(dict):
@@ -29,9 +36,26 @@ class BaseDict(dict):
         )
 
 
+def _invertible(value: Any) -> bool:
+    """
+    Whether ``value`` can be paired in the inverse map of a
+    :py:class:`BidirectionalDict`. Unhashable values, like the value lists of a
+    :py:class:`MultiEntryDict` mixin, are only stored forward.
+    """
+    return type(value).__hash__ is not None
+
+
 class BidirectionalDict(BaseDict):
     """Dictionary with two-way capabilities.
 
+    Pairs are stored in the dictionary itself and, reversed, in an inverse map, which
+    :py:attr:`inverse` exposes as a read-only view. Keys are looked up in both
+    directions, while iteration, ``len()`` and ``items()`` only cover the forward
+    pairs.
+
+    Assigning a key or value that is already paired drops the stale pair, so both
+    directions always stay consistent. Deleting a key or a value removes the pair.
+
     Example:
 
         .. code-block:: python
@@ -39,34 +63,122 @@ class BidirectionalDict(BaseDict):
             from plywoodpirate.collections.mapping import BidirectionalDict
 
             d = BidirectionalDict({"hello": "world"})
-            print(d) # >>> <BidirectionalDict {'hello': 'world', 'world': 'hello'}>
+            print(d) # >>> <BidirectionalDict {'hello': 'world'}>
+            print(d["world"], d.inverse["world"]) # >>> hello hello
+
+            d["hello"] = "mundo"
+            print("world" in d) # >>> False
     """
 
     def __init__(self, dictionary: Optional[dict] = None, **kwargs) -> dict:
-        dictionary = dictionary or {}
-        super(BidirectionalDict, self).__init__(
-            {
-                **dictionary,
-                **{v: k for k, v in dictionary.items()},
-                **kwargs,
-                **{v: k for k, v in kwargs.items()},
-            }
-        )
+        super(BidirectionalDict, self).__init__()
+        # Set past __setattr__, which mixins like ObjectDict turn into items.
+        object.__setattr__(self, "_inverse", {})
+        self.update(dictionary, **kwargs)
+
+    @property
+    def inverse(self) -> types.MappingProxyType:
+        """
+        Read-only view of the pairs from value to key.
+        """
+        return types.MappingProxyType(self._inverse)
+
+    def __missing__(self, key: Any) -> Any:
+        try:
+            return self._inverse[key]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or key in self._inverse
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        return self._inverse.get(key, default)
 
     def __setitem__(self, key: Any, value: Any):
+        inverse = self._inverse
+        if dict.__contains__(self, key):
+            self._unpair(dict.__getitem__(self, key))
+        invertible = _invertible(value)
+        if invertible and value in inverse:
+            dict.__delitem__(self, inverse[value])
+
         super(BidirectionalDict, self).__setitem__(key, value)
-        super(BidirectionalDict, self).__setitem__(value, key)
-
-    def update(self, dictionary: dict = Optional[dict], **kwargs):
-        dictionary = dictionary or {}
-        super(BidirectionalDict, self).update(
-            {
-                **dictionary,
-                **{v: k for k, v in dictionary.items()},
-                **kwargs,
-                **{v: k for k, v in kwargs.items()},
-            }
-        )
+        if invertible:
+            inverse[value] = key
+
+    def _unpair(self, value: Any):
+        if _invertible(value):
+            del self._inverse[value]
+
+    def __delitem__(self, key: Any):
+        if dict.__contains__(self, key):
+            self._unpair(super(BidirectionalDict, self).pop(key))
+        else:
+            super(BidirectionalDict, self).__delitem__(self._inverse.pop(key))
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if dict.__contains__(self, key):
+            value = super(BidirectionalDict, self).pop(key)
+            self._unpair(value)
+            return value
+        if key in self._inverse:
+            # Like ``d[value]``, popping a value removes the pair and returns its key.
+            paired = self._inverse.pop(key)
+            dict.__delitem__(self, paired)
+            return paired
+        return super(BidirectionalDict, self).pop(key, *default)
+
+    def popitem(self) -> tuple:
+        key, value = super(BidirectionalDict, self).popitem()
+        self._unpair(value)
+        return key, value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self):
+        super(BidirectionalDict, self).clear()
+        self._inverse.clear()
+
+    def update(self, dictionary: Optional[dict] = None, **kwargs):
+        if dictionary:
+            if hasattr(dictionary, "keys"):
+                dictionary = dictionary.items()
+            for key, value in dictionary:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __or__(self, other: dict) -> "BidirectionalDict":
+        if not isinstance(other, dict):
+            return NotImplemented
+        d = self.copy()
+        d.update(other)
+        return d
+
+    def __ior__(self, other: dict) -> "BidirectionalDict":
+        self.update(other)
+        return self
+
+    @classmethod
+    def fromkeys(
+        cls, iterable: Iterable[Any], value: Any = None
+    ) -> "BidirectionalDict":
+        d = cls()
+        for key in iterable:
+            d[key] = value
+        return d
+
+    def copy(self) -> "BidirectionalDict":
+        return self.__class__(self)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (dict(self),)
 
 
 class ObjectDict(BaseDict):
@@ -130,9 +242,29 @@ class OverloadedDict(BaseDict):
         return self
 
 
+def _normalize(key: Any) -> Any:
+    """
+    Key of the :py:class:`UnderscoreAccessDict` index, with underscores as spaces.
+    """
+    kind = type(key)
+    if kind is str:
+        return key.replace("_", " ")
+    elif kind is bytes:
+        return key.replace(b"_", b" ")
+    return key
+
+
 class UnderscoreAccessDict(BaseDict):
     """Dictionary that doesn't distinct keys with empty spaces and underscores.
 
+    Keys are indexed by their normalized form with underscores as spaces when they
+    are set, so a lookup normalizes the key once and probes the index once. Only if
+    that misses, a key with underscores is also looked up without them, e.g.
+    ``"_100"`` finds ``"100"``. Keys that differ in more than underscores and spaces,
+    like ``"ab"`` and ``"a b"``, stay distinct. ``in``, ``get``, ``pop``,
+    ``setdefault`` and ``del`` use the index too. Setting a key that matches an
+    existing key updates it, and keeps the existing spelling.
+
     Example:
 
         .. code-block:: python
@@ -145,20 +277,114 @@ class UnderscoreAccessDict(BaseDict):
             print(d['hello_world']) # >>> 'ola mundo'
     """
 
+    def __init__(self, dictionary: Optional[dict] = None, **kwargs):
+        super(UnderscoreAccessDict, self).__init__()
+        # Normalized key to the key as it was set. The value is only stored in the
+        # dictionary itself. Set past __setattr__, which mixins like ObjectDict turn
+        # into items.
+        object.__setattr__(self, "_index", {})
+        self.update(dictionary, **kwargs)
+
+    def _find(self, key: Any) -> Any:
+        """
+        Index key that ``key`` matches, or its normalized form if none matches.
+        """
+        normalized = _normalize(key)
+        if normalized not in self._index:
+            kind = type(key)
+            if kind is str:
+                stripped = key.replace("_", "")
+            elif kind is bytes:
+                stripped = key.replace(b"_", b"")
+            else:
+                return normalized
+            if stripped in self._index:
+                return stripped
+        return normalized
+
     def __getitem__(self, key: Any) -> Any:
-        if isinstance(key, bytes):
-            utw = key.replace(b"_", b" ")
-            wtu = key.replace(b"_", b"")
-        else:
-            utw = key.replace("_", " ")
-            wtu = key.replace("_", "")
+        try:
+            key = self._index[self._find(key)]
+        except KeyError:
+            raise KeyError(key) from None
+        return super(UnderscoreAccessDict, self).__getitem__(key)
+
+    def __setitem__(self, key: Any, value: Any):
+        normalized = self._find(key)
+        key = self._index.setdefault(normalized, key)
+        super(UnderscoreAccessDict, self).__setitem__(key, value)
+
+    def __delitem__(self, key: Any):
+        try:
+            key = self._index.pop(self._find(key))
+        except KeyError:
+            raise KeyError(key) from None
+        super(UnderscoreAccessDict, self).__delitem__(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) in self._index
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if self._find(key) not in self._index:
+            return default
+        return self[key]
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        stored = self._index.pop(self._find(key), _MISSING)
+        if stored is _MISSING:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return super(UnderscoreAccessDict, self).pop(stored)
+
+    def popitem(self) -> tuple:
+        key, value = super(UnderscoreAccessDict, self).popitem()
+        del self._index[_normalize(key)]
+        return key, value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if self._find(key) not in self._index:
+            self[key] = default
+        return self[key]
+
+    def clear(self):
+        super(UnderscoreAccessDict, self).clear()
+        self._index.clear()
 
-        if utw in self:
-            return super(UnderscoreAccessDict, self).__getitem__(utw)
-        elif wtu in self:
-            return super(UnderscoreAccessDict, self).__getitem__(wtu)
+    def update(self, dictionary: Optional[dict] = None, **kwargs):
+        if dictionary:
+            if hasattr(dictionary, "keys"):
+                dictionary = dictionary.items()
+            for key, value in dictionary:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __or__(self, other: dict) -> "UnderscoreAccessDict":
+        if not isinstance(other, dict):
+            return NotImplemented
+        d = self.copy()
+        d.update(other)
+        return d
+
+    def __ior__(self, other: dict) -> "UnderscoreAccessDict":
+        self.update(other)
+        return self
 
-        return super(UnderscoreAccessDict, self).__getitem__(key)
+    @classmethod
+    def fromkeys(
+        cls, iterable: Iterable[Any], value: Any = None
+    ) -> "UnderscoreAccessDict":
+        d = cls()
+        for key in iterable:
+            d[key] = value
+        return d
+
+    def copy(self) -> "UnderscoreAccessDict":
+        return self.__class__(self)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (dict(self),)
 
 
 class FrozenDict(BaseDict):
@@ -173,6 +399,8 @@ class FrozenDict(BaseDict):
 
         d['ola'] = 'mundo'
         # >>> KeyError: 'Cannot set key and value because this is a frozen dictionary.'
+
+    Every method that would change the dictionary raises ``KeyError``.
     """
 
     def __setitem__(self, key, value):
@@ -183,34 +411,236 @@ class FrozenDict(BaseDict):
         err = "Cannot set key and value because this is a frozen dictionary."
         raise KeyError(err)
 
+    def setdefault(self, key, default=None):
+        err = "Cannot set key and value because this is a frozen dictionary."
+        raise KeyError(err)
+
+    def __ior__(self, other):
+        err = "Cannot set key and value because this is a frozen dictionary."
+        raise KeyError(err)
+
+    def __delitem__(self, key):
+        err = "Cannot remove key because this is a frozen dictionary."
+        raise KeyError(err)
+
+    def pop(self, key, *default):
+        err = "Cannot remove key because this is a frozen dictionary."
+        raise KeyError(err)
+
+    def popitem(self):
+        err = "Cannot remove key because this is a frozen dictionary."
+        raise KeyError(err)
+
+    def clear(self):
+        err = "Cannot remove key because this is a frozen dictionary."
+        raise KeyError(err)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (dict(self),)
+
 
 class MultiEntryDict(BaseDict):
     """Dictionary that can have multiple entries for the same key.
 
+    Every key maps to the list of its values, in insertion order, no matter how many
+    values it has. Setting a key adds another value instead of replacing them. With
+    ``typecode``, values are stored in an :py:class:`array.array` of that type instead
+    of a list, e.g. ``"d"`` for floats, to save memory.
+
+    The dictionary can be created from a mapping, a ``MultiEntryDict`` or an iterable
+    of key and value pairs.
+
     .. code-block:: python
 
         from plywoodpirate.collections.mapping import MultiEntryDict
 
-        d = MultiEntryDict({"hello": "world", "hello": "mundo"})
+        d = MultiEntryDict([("hello", "world"), ("hello", "mundo")])
         print(d) # >>> <MultiEntryDict {'hello': ['world', 'mundo']}>
 
         d['hello'] = 'globo'
         print(d) # >>> <MultiEntryDict {'hello': ['world', 'mundo', 'globo']}>
+
+        print(d.getone("hello"), d.count("hello")) # >>> world 3
+        print(list(d.items(multi=True))[0]) # >>> ('hello', 'world')
     """
 
-    def __setitem__(self, key, value):
-        if key in self:
-            if isinstance(self[key], list):
-                self[key].append(value)
+    def __init__(
+        self,
+        dictionary: Optional[dict] = None,
+        typecode: Optional[str] = None,
+        **kwargs,
+    ):
+        super(MultiEntryDict, self).__init__()
+        # Set past __setattr__, which mixins like ObjectDict turn into items.
+        object.__setattr__(self, "_typecode", typecode)
+        self.update(dictionary, **kwargs)
+
+    def add(self, key: Any, value: Any):
+        """
+        Add ``value`` to the values of ``key``.
+        """
+        # Stores and lookups go through super(), so mixins see the keys.
+        values = super(MultiEntryDict, self).get(key)
+        if values is None:
+            if self._typecode is None:
+                values = [value]
             else:
-                super().__setitem__(key, [self[key], value])
+                values = array.array(self._typecode, (value,))
+            super(MultiEntryDict, self).__setitem__(key, values)
         else:
-            super(MultiEntryDict, self).__setitem__(key, value)
+            values.append(value)
+
+    __setitem__ = add
+
+    def extend(self, pairs: Optional[Iterable[Tuple[Any, Any]]] = None):
+        """
+        Add all values of a mapping, a ``MultiEntryDict`` or an iterable of key and
+        value pairs.
+        """
+        if not pairs:
+            return
+        if isinstance(pairs, MultiEntryDict):
+            pairs = pairs.items(multi=True)
+        elif hasattr(pairs, "keys"):
+            pairs = pairs.items()
+
+        add = self.add
+        for key, value in pairs:
+            add(key, value)
+
+    def update(self, dictionary: Optional[dict] = None, **kwargs):
+        self.extend(dictionary)
+        self.extend(kwargs)
+
+    def setdefault(self, key: Any, default: Any = None) -> list:
+        """
+        Values of ``key``, after adding ``default`` if ``key`` has no values yet.
+        """
+        if not super(MultiEntryDict, self).__contains__(key):
+            self.add(key, default)
+        return self[key]
+
+    def __or__(self, other: dict) -> "MultiEntryDict":
+        if not isinstance(other, dict):
+            return NotImplemented
+        d = self.copy()
+        d.extend(other)
+        return d
+
+    def __ior__(self, other: dict) -> "MultiEntryDict":
+        self.extend(other)
+        return self
+
+    @classmethod
+    def fromkeys(cls, iterable: Iterable[Any], value: Any = None) -> "MultiEntryDict":
+        d = cls()
+        for key in iterable:
+            d.add(key, value)
+        return d
+
+    def getall(self, key: Any, default: Any = _MISSING) -> list:
+        """
+        List of all values of ``key``.
+
+        Raises:
+            KeyError: If ``key`` has no values and no ``default`` is given.
+        """
+        values = super(MultiEntryDict, self).get(key)
+        if values is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return list(values)
+
+    def getone(self, key: Any, default: Any = _MISSING) -> Any:
+        """
+        First value of ``key``.
+
+        Raises:
+            KeyError: If ``key`` has no values and no ``default`` is given.
+        """
+        values = super(MultiEntryDict, self).get(key)
+        if values is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return values[0]
+
+    def count(self, key: Any) -> int:
+        """
+        Number of values of ``key``.
+        """
+        values = super(MultiEntryDict, self).get(key)
+        return 0 if values is None else len(values)
+
+    def items(self, multi: bool = False) -> Iterable[Tuple[Any, Any]]:
+        """
+        Pairs of keys and their value lists, or of keys and every single value if
+        ``multi`` is True.
+        """
+        if not multi:
+            return super(MultiEntryDict, self).items()
+        return (
+            (key, value)
+            for key, values in super(MultiEntryDict, self).items()
+            for value in values
+        )
+
+    def copy(self) -> "MultiEntryDict":
+        return self.__class__(self, typecode=self._typecode)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (list(self.items(multi=True)), self._typecode)
+
+
+def _item_key(key: ItemType) -> Union[bytes, Item]:
+    """
+    Key to look up ``key`` in an :py:class:`ItemDict` with.
+
+    ``str``, ``bytes`` and ``int`` keys are converted to their bytes representation,
+    which has the same hash as and compares equal to the stored ``Item``, so no
+    ``Item`` has to be created just for the lookup.
+    """
+    kind = type(key)
+    if kind is bytes:
+        return key
+    elif kind is str:
+        return key.encode(ENCODE)
+    elif kind is int:
+        return b"%d" % key
+    elif kind is Item:
+        return key
+    return Item(key)
+
+
+def _item(item: ItemType) -> Item:
+    """
+    ``item`` as new :py:class:`Item`. Shared items, e.g. from
+    :py:meth:`ItemPool.intern`, are kept as they are, because they are never modified
+    in place.
+    """
+    return item if isinstance(item, Item) and item._shared else Item(item)
+
+
+def _item_pairs(pairs: Iterable[Tuple[ItemType, Any]]) -> Iterator[Tuple[Item, Any]]:
+    """
+    Convert key and value pairs for an :py:class:`ItemDict` one at a time.
+    """
+    for key, value in pairs:
+        if isinstance(value, list):
+            yield _item(key), [_item(i) for i in value]
+        else:
+            yield _item(key), _item(value)
 
 
 class ItemDict(BaseDict):
     """Dictionary composed of :py:class:`plywoodpirate.collections.item.Item` key and values.
 
+    Lookups with ``str``, ``bytes`` and ``int`` keys hash their bytes representation
+    directly, without creating an ``Item`` for every call. Keys and values are
+    copied into new items, except for shared items interned with
+    :py:class:`plywoodpirate.collections.item.ItemPool`, which are stored as they are.
+
     Example:
 
         .. code-block:: python
@@ -225,39 +655,128 @@ class ItemDict(BaseDict):
     """
 
     def __init__(self, dictionary: Optional[dict] = None, **kwargs):
-        dictionary = dictionary or {}
-        kwargs = kwargs or {}
-        dictionary = {**dictionary, **kwargs}
-
-        new = {}
-        for k, v in dictionary.items():
-            if isinstance(v, list):
-                new[Item(k)] = [Item(i) for i in v]
-            else:
-                new[Item(k)] = Item(v)
-
-        return super(ItemDict, self).__init__(new)
+        super(ItemDict, self).__init__()
+        self.update(dictionary, **kwargs)
+
+    @classmethod
+    def from_pairs(
+        cls, pairs: Iterable[Tuple[ItemType, Any]], size_hint: Optional[int] = None
+    ) -> "ItemDict":
+        """
+        Create an ItemDict from an iterable of key and value pairs.
+
+        The pairs are consumed lazily and converted in a single pass, without
+        intermediate dictionaries, so generators over large inputs stream straight
+        into the new dictionary. Later pairs overwrite earlier pairs with equal keys.
+
+        Args:
+            pairs: Iterable of ``(key, value)`` tuples.
+            size_hint: Expected number of entries. It is advisory only, because
+                CPython dictionaries cannot be preallocated.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.collections.mapping import ItemDict
+
+                d = ItemDict.from_pairs((row[0], row[1]) for row in csv.reader(f))
+        """
+        d = cls()
+        dict.update(d, _item_pairs(pairs))
+        return d
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, os.PathLike],
+        sep: str = "=",
+        comment: str = "#",
+        encoding: str = "utf-8",
+        size_hint: Optional[int] = None,
+    ) -> "ItemDict":
+        """
+        Create an ItemDict from a file with one ``key<sep>value`` entry per line.
+
+        The file is read line by line. Whitespace around keys and values is stripped,
+        empty lines and lines starting with ``comment`` are skipped.
+
+        Args:
+            path: Path of the file.
+            sep: Separator between key and value. Only the first one splits.
+            comment: Prefix of comment lines.
+            encoding: Encoding of the file.
+            size_hint: Expected number of entries, see :py:meth:`from_pairs`.
+
+        Raises:
+            ValueError: If a line has no separator.
+        """
+
+        def pairs(f):
+            for number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or (comment and line.startswith(comment)):
+                    continue
+                key, found, value = line.partition(sep)
+                if not found:
+                    err = "Line {} of {} has no separator {!r}.".format(
+                        number, path, sep
+                    )
+                    raise ValueError(err)
+                yield key.rstrip(), value.lstrip()
+
+        with open(path, encoding=encoding) as f:
+            return cls.from_pairs(pairs(f), size_hint=size_hint)
+
+    @classmethod
+    def from_configparser(
+        cls, section: configparser.SectionProxy, size_hint: Optional[int] = None
+    ) -> "ItemDict":
+        """
+        Create an ItemDict from a section of a :py:class:`configparser.ConfigParser`.
+
+        Values are interpolated and converted one at a time, including defaults of the
+        parser, like ``section.items()`` returns them.
+
+        Args:
+            section: Section of the parser, e.g. ``parser["server"]``.
+            size_hint: Expected number of entries, see :py:meth:`from_pairs`.
+        """
+        return cls.from_pairs(section.items(), size_hint=size_hint)
+
+    # The lookups call dict directly, super() costs more than the lookup itself.
 
     def __getitem__(self, key: ItemType):
-        return super(ItemDict, self).__getitem__(Item(key))
+        return dict.__getitem__(self, _item_key(key))
 
     def __setitem__(self, key: ItemType, value: ItemType):
+        _key = _item_key(key)
+        # Existing entries keep their Item key, only new keys need one.
+        if type(_key) is bytes:
+            if not dict.__contains__(self, _key):
+                _key = Item(key)
+        elif not dict.__contains__(self, _key):
+            _key = _item(key)
+
+        # Stores go through super(), so mixins like MultiEntryDict see them.
         if isinstance(value, list):
-            super(ItemDict, self).__setitem__(Item(key), [Item(i) for i in value])
+            super(ItemDict, self).__setitem__(_key, [_item(i) for i in value])
         else:
-            super(ItemDict, self).__setitem__(Item(key), Item(value))
+            super(ItemDict, self).__setitem__(_key, _item(value))
 
     def __delitem__(self, key: ItemType):
-        super(ItemDict, self).__delitem__(Item(key))
+        dict.__delitem__(self, _item_key(key))
 
     def __contains__(self, key: ItemType):
-        return super(ItemDict, self).__contains__(Item(key))
+        return dict.__contains__(self, _item_key(key))
+
+    def get(self, key: ItemType, default: Any = None) -> Any:
+        return dict.get(self, _item_key(key), default)
 
     def update(self, dictionary: Optional[dict] = None, **kwargs):
-        dictionary = dictionary or {}
-        super(ItemDict, self).update(
-            {
-                **{Item(k): Item(v) for k, v in dictionary.items()},
-                **{Item(k): Item(v) for k, v in kwargs.items()},
-            },
-        )
+        if dictionary:
+            if hasattr(dictionary, "keys"):
+                dictionary = dictionary.items()
+            dict.update(self, _item_pairs(dictionary))
+        if kwargs:
+            dict.update(self, _item_pairs(kwargs.items()))
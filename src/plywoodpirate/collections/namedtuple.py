@@ -1,12 +1,31 @@
 from collections import namedtuple
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Iterator, Union
 
 
-def nestednamedtuple(dictionary: dict) -> namedtuple:
+@lru_cache(maxsize=1024)
+def _namedtuple_class(fields: tuple) -> type:
+    """
+    Namedtuple class for ``fields``, shared by all mappings with the same keys.
+    """
+    return namedtuple("namedtupled", fields)
+
+
+def nestednamedtuple(dictionary: dict, lazy: bool = False) -> namedtuple:
     """Converts dictionary to a nested namedtuple recursively.
 
+    Mappings with the same keys in the same order share one namedtuple class, so
+    converting many records of the same shape creates the class only once.
+
+    With ``lazy``, nothing is converted up front. Instead, a read-only proxy is
+    returned that converts nested mappings and lists when they are accessed for the
+    first time, and leaves ``dictionary`` untouched. It supports attribute and index
+    access, iteration, ``_fields`` and ``_asdict()`` like a namedtuple.
+
     Args:
         dictionary: Dictionary to convert into a nested namedtuple.
+        lazy: Whether to convert on access instead of up front.
 
     Example:
 
@@ -16,12 +35,16 @@ def nestednamedtuple(dictionary: dict) -> namedtuple:
 
             nt = nestednamedtuple({"hello": {"ola": "mundo"}})
             print(nt) # >>> namedtupled(hello=namedtupled(ola='mundo'))
+
+            nt = nestednamedtuple(json.load(f), lazy=True)
+            print(nt.hello.ola) # >>> 'mundo', only converts the accessed path
     """
+    if lazy:
+        return _lazy(dictionary)
 
     if isinstance(dictionary, Mapping) and not isinstance(dictionary, fdict):
-        for key, value in list(dictionary.items()):
-            dictionary[key] = nestednamedtuple(value)
-        return namedtuple("namedtupled", dictionary)(**dictionary)
+        values = {key: nestednamedtuple(value) for key, value in dictionary.items()}
+        return _namedtuple_class(tuple(values))(**values)
     elif isinstance(dictionary, list):
         return [nestednamedtuple(item) for item in dictionary]
 
@@ -42,3 +65,107 @@ class fdict(dict):
             print(nt.notforced)    # >>> namedtupled(hello='world')
             print(nt.forced)       # >>> {'hello': 'world'}
     """
+
+
+def _lazy(value: Any) -> Any:
+    """
+    Wraps mappings and lists in read-only proxies that convert on access.
+    """
+    if isinstance(value, Mapping) and not isinstance(value, fdict):
+        return _LazyNamedTuple(value)
+    elif isinstance(value, list):
+        return _LazyList(value)
+    return value
+
+
+class _LazyNamedTuple:
+    """Read-only namedtuple-like proxy of a mapping, converting values on access."""
+
+    __slots__ = ("_source", "_cache")
+
+    def __init__(self, source: Mapping):
+        object.__setattr__(self, "_source", source)
+        object.__setattr__(self, "_cache", {})
+
+    def __getattr__(self, name: str) -> Any:
+        cache = self._cache
+        try:
+            return cache[name]
+        except KeyError:
+            pass
+        try:
+            value = self._source[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = cache[name] = _lazy(value)
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("can't set attribute")
+
+    def __delattr__(self, name: str):
+        raise AttributeError("can't delete attribute")
+
+    @property
+    def _fields(self) -> tuple:
+        return tuple(self._source)
+
+    def _asdict(self) -> dict:
+        return {name: getattr(self, name) for name in self._source}
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        fields = self._fields[index]
+        if isinstance(index, slice):
+            return tuple(getattr(self, name) for name in fields)
+        return getattr(self, fields)
+
+    def __iter__(self) -> Iterator:
+        for name in self._source:
+            yield getattr(self, name)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (tuple, _LazyNamedTuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ("{}={!r}".format(name, getattr(self, name)) for name in self._source)
+        return "namedtupled({})".format(", ".join(fields))
+
+
+class _LazyList(Sequence):
+    """Read-only proxy of a list, converting items on access."""
+
+    __slots__ = ("_source", "_cache")
+
+    def __init__(self, source: list):
+        self._source = source
+        self._cache = {}
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self._source))[index]]
+        index = range(len(self._source))[index]
+        try:
+            return self._cache[index]
+        except KeyError:
+            value = self._cache[index] = _lazy(self._source[index])
+            return value
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, _LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
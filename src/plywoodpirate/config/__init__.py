@@ -1,10 +1,14 @@
 # <> with ❤️ by Micha Grandel - hello@michagrandel.eu
 
-__all__ = ['ConfigurationFile', 'conf', 'config', 'make_config']
+__all__ = ['ConfigurationFile', 'conf', 'config', 'make_config', 'snapshot', 'Snapshot',
+           'config_override']
 
 from .ConfigurationFile import ConfigurationFile
 from .globalconfig import (
     conf,
     config,
-    make_config
+    make_config,
+    snapshot,
+    Snapshot,
+    config_override,
 )
\ No newline at end of file
@@ -1,9 +1,94 @@
-__all__ = ["make_config", "conf", "config"]
+__all__ = ["make_config", "conf", "config", "snapshot", "Snapshot", "config_override"]
 
+import contextvars
+import threading
 from collections import namedtuple
-from typing import Optional
+from collections.abc import Mapping
+from typing import Any, NamedTuple, Optional
 
-from ..collections import nestednamedtuple
+from ..collections import FrozenDict, fdict, nestednamedtuple
+
+
+class Snapshot(NamedTuple):
+    """Immutable, versioned state of the global configuration."""
+
+    version: int
+    config: FrozenDict
+    conf: tuple
+
+
+_snapshot = Snapshot(0, FrozenDict(), nestednamedtuple({}))
+_lock = threading.Lock()
+_override: contextvars.ContextVar = contextvars.ContextVar(
+    "plywoodpirate_config_override", default=None
+)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Frozen copy of ``value``: mappings become :class:`FrozenDict`, lists and tuples
+    become tuples and sets become frozensets, recursively.
+
+    Only containers are copied, other values are kept as they are, so values that
+    can't be copied like locks are accepted. Forced dictionaries stay a copied
+    :class:`fdict`, so they don't become namedtuples.
+    """
+    if isinstance(value, fdict):
+        return fdict({key: _freeze(item) for key, item in value.items()})
+    elif isinstance(value, Mapping):
+        return FrozenDict({key: _freeze(item) for key, item in value.items()})
+    elif isinstance(value, (list, tuple)) and not hasattr(value, "_fields"):
+        return tuple(_freeze(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _convert(value: Any) -> Any:
+    """
+    :func:`nestednamedtuple` of a frozen ``value``, converting mappings inside tuples
+    like it does inside lists.
+    """
+    if isinstance(value, Mapping) and not isinstance(value, fdict):
+        return nestednamedtuple({key: _convert(item) for key, item in value.items()})
+    elif type(value) is tuple:
+        return tuple(_convert(item) for item in value)
+    return value
+
+
+def _merge(base: Mapping, override: Mapping) -> dict:
+    """
+    Merge ``override`` into a copy of ``base``, recursing into nested mappings.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        current = merged.get(key)
+        if (
+            isinstance(value, Mapping)
+            and isinstance(current, Mapping)
+            and not isinstance(value, fdict)
+        ):
+            value = _merge(current, value)
+        merged[key] = value
+    return merged
+
+
+class _Layer:
+    """
+    Entered :class:`config_override` on top of the global configuration or another
+    layer, with the token to restore the layer below it.
+    """
+
+    __slots__ = ("parent", "override", "token")
+
+    def __init__(self, parent: Optional["_Layer"], override: "config_override"):
+        self.parent = parent
+        self.override = override
+        self.token = None
+
+    def snapshot(self) -> Snapshot:
+        base = _snapshot if self.parent is None else self.parent.snapshot()
+        return self.override._merged(base)
 
 
 def make_config(dictionary: Optional[dict] = None, **kwargs) -> None:
@@ -13,6 +98,12 @@ def make_config(dictionary: Optional[dict] = None, **kwargs) -> None:
     Instead of creating a `Config` object, one may use :func:`make_config` to create a
     global runtime configuration that can be accessed by any module, function, or object.
 
+    The configuration is copied and converted once into an immutable
+    :class:`Snapshot`, which replaces the previous one in a single step. Readers never
+    see a partial update, and :func:`conf` and :func:`config` only return the current
+    snapshot. Nested dictionaries of :func:`config` are frozen as well, and lists
+    become tuples.
+
     Args:
         dictionary: Dictionary to create global configuration with.
         kwargs: Arguments to make global configuration with.
@@ -25,8 +116,28 @@ def make_config(dictionary: Optional[dict] = None, **kwargs) -> None:
 
             make_config(hello="world")
     """
-    dictionary = dictionary or {}
-    globals()["gconf"] = {**dictionary, **kwargs}
+    global _snapshot
+
+    frozen = _freeze({**(dictionary or {}), **kwargs})
+    converted = _convert(frozen)
+    with _lock:
+        _snapshot = Snapshot(_snapshot.version + 1, frozen, converted)
+
+
+def snapshot() -> Snapshot:
+    """Access the current version of the global configuration, as dict and namedtuple.
+
+    Example:
+
+        .. code-block:: python
+
+            from plywoodpirate.config.globalconfig import snapshot
+
+            current = snapshot()
+            print(current.version, current.conf.hello) # >>> 1 'world'
+    """
+    layer = _override.get()
+    return _snapshot if layer is None else layer.snapshot()
 
 
 def conf() -> namedtuple:
@@ -40,15 +151,11 @@ def conf() -> namedtuple:
 
             print(conf().hello) # >>> 'world'
     """
-    g = globals()
-    if "gconf" in g:
-        return nestednamedtuple(g["gconf"])
-    else:
-        return nestednamedtuple({})
+    return snapshot().conf
 
 
 def config() -> dict:
-    """Access global configuration as a dict.
+    """Access global configuration as a :class:`~plywoodpirate.collections.FrozenDict`.
 
     Example:
 
@@ -58,8 +165,75 @@ def config() -> dict:
 
             print(config()['hello']) # >>> 'world'
     """
-    g = globals()
-    if "gconf" in g:
-        return g["gconf"]
-    else:
-        return {}
+    return snapshot().config
+
+
+class config_override:
+    def __init__(self, dictionary: Optional[dict] = None, **kwargs):
+        """
+        Context manager that overrides the global configuration for everything inside.
+
+        The overrides are stored in a :class:`contextvars.ContextVar`, so they apply
+        to the current thread or asyncio task and to everything called from it,
+        without affecting concurrent requests. Overrides can be nested, and nested
+        dictionaries are merged. :func:`conf`, :func:`config` and :func:`snapshot`
+        return the merged configuration, which is cached until :func:`make_config`
+        replaces the global configuration.
+
+        The values are copied and frozen when the override is created. One instance
+        may be reused, also by concurrent tasks, and keeps its merged configuration.
+
+        Args:
+            dictionary: Dictionary of values to override.
+            kwargs: Values to override.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.config.globalconfig import (
+                    conf,
+                    config_override,
+                    make_config,
+                )
+
+                make_config(timeout=30, db={"host": "db", "pool": 10})
+
+                async def handle(request):
+                    with config_override(timeout=5, db={"pool": 2}):
+                        print(conf().timeout, conf().db.host) # >>> 5 'db'
+        """
+        self._values = _freeze({**(dictionary or {}), **kwargs})
+        self._cache = None
+
+    def _merged(self, base: Snapshot) -> Snapshot:
+        """
+        Snapshot of ``base`` with the overrides, cached until ``base`` changes.
+
+        The cache belongs to the instance, so an override that is reused, e.g. for
+        every request, merges only once.
+        """
+        cache = self._cache
+        if cache is None or cache[0] is not base:
+            merged = _freeze(_merge(base.config, self._values))
+            cache = self._cache = (
+                base,
+                Snapshot(base.version, merged, _convert(merged)),
+            )
+        return cache[1]
+
+    def __enter__(self) -> "config_override":
+        layer = _Layer(_override.get(), self)
+        # The token is kept by the layer of the current context, so one instance
+        # may be entered by concurrent tasks.
+        layer.token = _override.set(layer)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _override.reset(_override.get().token)
+
+    async def __aenter__(self) -> "config_override":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
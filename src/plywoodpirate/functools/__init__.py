@@ -1,5 +1,34 @@
 """ Higher-order functions and operations on callable objects. """
 
-__all__ = ['timeout']
+__all__ = [
+    'timeout',
+    'deadline',
+    'DeadlineExceeded',
+    'retry',
+    'RetryBudget',
+    'TokenBucket',
+    'SlidingWindow',
+    'RateLimitExceeded',
+    'rate_limit',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'circuit_breaker',
+    'hedge',
+    'LatencyTracker',
+    'debounce',
+    'throttle',
+    'cached_method',
+    'async_cached_property',
+    'profiled',
+    'Histogram',
+]
 
+from .cached import cached_method, async_cached_property
+from .circuitbreaker import CircuitBreaker, CircuitOpenError, circuit_breaker
+from .coalesce import debounce, throttle
+from .deadline import deadline, DeadlineExceeded
+from .hedge import hedge, LatencyTracker
+from .profiling import profiled, Histogram
+from .ratelimit import TokenBucket, SlidingWindow, RateLimitExceeded, rate_limit
+from .retry import retry, RetryBudget
 from .timeout import timeout
@@ -0,0 +1,196 @@
+__all__ = ["cached_method", "async_cached_property"]
+
+import asyncio
+import collections
+import functools
+import threading
+import time
+import weakref
+from functools import _make_key
+from typing import Any, Callable, Optional
+
+
+class cached_method:
+    def __init__(
+        self,
+        func: Optional[Callable] = None,
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Decorator to cache the return values of a method per instance.
+
+        Unlike :func:`functools.lru_cache` on a method, the cache does not keep the
+        instance alive: every instance has its own cache, which is dropped as soon as
+        the instance is garbage collected. Instances don't need to be hashable, but
+        they must support weak references.
+
+        The bound method has ``cache_clear()`` and ``cache_len()`` methods for the
+        cache of its instance.
+
+        Args:
+            func: The method to cache.
+            maxsize: Maximum number of cached results per instance. None is unbounded.
+            ttl: Seconds a cached result stays valid. None never expires.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.cached import cached_method
+
+                class Service:
+                    @cached_method(maxsize=1024, ttl=60)
+                    def lookup(self, key):
+                        # Expensive computation.
+                        return key * 2
+
+                service = Service()
+                service.lookup(21)  # Runs it once.
+                service.lookup(21)  # Returns the cached value.
+                service.lookup.cache_clear()
+        """
+        self._func = func
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._caches = {}
+        self._lock = threading.Lock()
+        if func is not None:
+            functools.update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        """
+        Support ``@cached_method(...)`` with arguments, and calls through the class.
+        """
+        if self._func is None:
+            return cached_method(args[0], maxsize=self._maxsize, ttl=self._ttl)
+        return self.__get__(args[0])(*args[1:], **kwargs)
+
+    def _method(self, instance: Any) -> Callable:
+        key = id(instance)
+        method = self._caches.get(key)
+        if method is None:
+            with self._lock:
+                method = self._caches.get(key)
+                if method is None:
+                    method = self._caches[key] = self._bind(instance)
+                    weakref.finalize(instance, self._caches.pop, key, None)
+        return method
+
+    def _bind(self, instance: Any) -> Callable:
+        """
+        Bound method with the cache of ``instance``, created once per instance.
+
+        It only keeps a weak reference, so the instance and its cache are dropped
+        together.
+        """
+        cache = collections.OrderedDict()
+        ref = weakref.ref(instance)
+        call = self._call
+
+        def method(*args, **kwargs):
+            instance = ref()
+            if instance is None:
+                raise ReferenceError("Instance of cached method was garbage collected.")
+            return call(instance, cache, args, kwargs)
+
+        functools.update_wrapper(method, self._func)
+        method.cache_clear = cache.clear
+        method.cache_len = cache.__len__
+        return method
+
+    def _call(self, instance: Any, cache: collections.OrderedDict, args, kwargs):
+        key = _make_key(args, kwargs, False) if kwargs else args
+        now = time.monotonic() if self._ttl is not None else 0.0
+
+        # Lookups don't take the lock, the entry may only be evicted concurrently.
+        entry = cache.get(key)
+        if entry is not None and (self._ttl is None or entry[0] > now):
+            if self._maxsize is not None:
+                try:
+                    cache.move_to_end(key)
+                except KeyError:
+                    pass
+            return entry[1]
+
+        result = self._func(instance, *args, **kwargs)
+
+        with self._lock:
+            cache[key] = (now + (self._ttl or 0.0), result)
+            cache.move_to_end(key)
+            if self._maxsize is not None and len(cache) > self._maxsize:
+                cache.popitem(last=False)
+        return result
+
+    def __get__(self, instance: Any, owner: type = None) -> Callable:
+        if instance is None:
+            return self
+        return self._method(instance)
+
+
+class async_cached_property:
+    def __init__(self, func: Callable):
+        """
+        Decorator for an async property that is computed once per instance.
+
+        The first access starts the computation as a task. Every access while it runs
+        waits for that same task, so it runs only once, even for concurrent callers.
+        Cancelling one waiter does not cancel the task for the others. If the
+        computation fails, the next access starts it again. Use ``del obj.attr`` to
+        reset the cached value.
+
+        Like :class:`functools.cached_property`, the value is stored in the instance
+        ``__dict__`` and dropped along with the instance.
+
+        Args:
+            func: Coroutine function computing the value.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.cached import async_cached_property
+
+                class Service:
+                    @async_cached_property
+                    async def settings(self):
+                        return await fetch_settings()
+
+                async def main():
+                    service = Service()
+                    settings = await service.settings  # Fetches the settings once.
+                    settings = await service.settings  # Returns the cached value.
+        """
+        self._func = func
+        self._name = "_async_cached_" + func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = "_async_cached_" + name
+
+    def __get__(self, instance: Any, owner: type = None):
+        if instance is None:
+            return self
+
+        storage = instance.__dict__
+        task = storage.get(self._name)
+        if task is None:
+            task = storage[self._name] = asyncio.ensure_future(self._func(instance))
+            name = self._name
+
+            def forget(done: asyncio.Future):
+                if done.cancelled() or done.exception() is not None:
+                    if storage.get(name) is done:
+                        del storage[name]
+
+            task.add_done_callback(forget)
+
+        if task.done():
+            return task
+        return asyncio.shield(task)
+
+    def __set__(self, instance: Any, value: Any):
+        raise AttributeError("Cannot set async cached property.")
+
+    def __delete__(self, instance: Any):
+        instance.__dict__.pop(self._name, None)
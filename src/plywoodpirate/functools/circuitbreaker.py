@@ -0,0 +1,284 @@
+__all__ = ["CircuitBreaker", "CircuitOpenError", "circuit_breaker"]
+
+import collections
+import functools
+import inspect
+import threading
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, Union
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+ExceptionTypes = Union[Type[BaseException], Tuple[Type[BaseException], ...]]
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling the function while the circuit is open.
+    """
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        error_rate: float = 0.5,
+        latency: Optional[float] = None,
+        slow_rate: float = 0.5,
+        window: float = 10.0,
+        minimum_calls: int = 10,
+        recovery: float = 30.0,
+        probes: int = 1,
+        exceptions: ExceptionTypes = Exception,
+        on_state_change: Optional[Callable[["CircuitBreaker", str, str], None]] = None,
+    ):
+        """
+        Stops calling a failing dependency, and lets it recover.
+
+        The breaker starts *closed* and records the outcome of every call within the
+        last ``window`` seconds. Once at least ``minimum_calls`` were recorded and the
+        share of failed calls reaches ``error_rate``, or the share of calls slower
+        than ``latency`` reaches ``slow_rate``, it *opens*. While open, calls fail
+        immediately with :class:`CircuitOpenError`. After ``recovery`` seconds it is
+        *half-open* and lets ``probes`` calls through: if they all succeed it closes
+        again, otherwise it opens for another ``recovery`` seconds.
+
+        Args:
+            error_rate: Share of failed calls that opens the circuit.
+            latency: Calls slower than this many seconds are slow. None disables it.
+            slow_rate: Share of slow calls that opens the circuit.
+            window: Length of the rolling window in seconds.
+            minimum_calls: Calls in the window needed before the circuit can open.
+            recovery: Seconds the circuit stays open before probing.
+            probes: Number of probe calls in half-open state.
+            exceptions: Exceptions that count as failures. Other exceptions are
+                passed through and count as successful calls.
+            on_state_change: Called with the breaker, the old and the new state
+                whenever the state changes, e.g. to record metrics.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.circuitbreaker import CircuitBreaker
+
+                breaker = CircuitBreaker(error_rate=0.5, latency=1.0, recovery=10)
+
+                @breaker
+                def fetch(url):
+                    return requests.get(url, timeout=5)
+        """
+        self.error_rate = error_rate
+        self.latency = latency
+        self.slow_rate = slow_rate
+        self.window = window
+        self.minimum_calls = minimum_calls
+        self.recovery = recovery
+        self.probes = probes
+        self.exceptions = exceptions
+        self.on_state_change = on_state_change
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened = 0.0
+        self._calls = collections.deque()
+        self._failures = 0
+        self._slow = 0
+        self._probing = 0
+        self._probed = 0
+
+    @property
+    def state(self) -> str:
+        """
+        Current state: ``"closed"``, ``"open"`` or ``"half-open"``.
+        """
+        with self._lock:
+            changes = self._refresh(time.monotonic())
+        self._notify(changes)
+        return self._state
+
+    def _set_state(self, state: str, now: float, changes: list):
+        changes.append((self._state, state))
+        self._state = state
+        if state == OPEN:
+            self._opened = now
+        elif state == HALF_OPEN:
+            self._probing = self._probed = 0
+        else:
+            self._calls.clear()
+            self._failures = self._slow = 0
+
+    def _refresh(self, now: float) -> list:
+        changes = []
+        if self._state == OPEN and now - self._opened >= self.recovery:
+            self._set_state(HALF_OPEN, now, changes)
+        return changes
+
+    def _notify(self, changes: list):
+        if self.on_state_change:
+            for old, new in changes:
+                self.on_state_change(self, old, new)
+
+    def _before(self) -> bool:
+        """
+        Admit a call, returning whether it is a probe.
+        """
+        probe = False
+        with self._lock:
+            changes = self._refresh(time.monotonic())
+            state = self._state
+            if state == HALF_OPEN and self._probing + self._probed < self.probes:
+                self._probing += 1
+                probe = True
+        self._notify(changes)
+
+        if state == CLOSED or probe:
+            return probe
+        raise CircuitOpenError("Circuit is {}.".format(state))
+
+    def _after(self, probe: bool, duration: float, failed: Optional[bool]):
+        """
+        Record the outcome of an admitted call. None records no outcome.
+        """
+        if failed is None:
+            if probe:
+                with self._lock:
+                    self._probing -= 1
+            return
+
+        now = time.monotonic()
+        slow = self.latency is not None and duration > self.latency
+        changes = []
+
+        with self._lock:
+            if probe:
+                self._probing -= 1
+                if self._state == HALF_OPEN:
+                    if failed or slow:
+                        self._set_state(OPEN, now, changes)
+                    else:
+                        self._probed += 1
+                        if self._probed >= self.probes:
+                            self._set_state(CLOSED, now, changes)
+            elif self._state == CLOSED:
+                self._record(now, failed, slow, changes)
+
+        self._notify(changes)
+
+    def _record(self, now: float, failed: bool, slow: bool, changes: list):
+        calls = self._calls
+        calls.append((now, failed, slow))
+        self._failures += failed
+        self._slow += slow
+
+        while calls and calls[0][0] <= now - self.window:
+            _, f, s = calls.popleft()
+            self._failures -= f
+            self._slow -= s
+
+        total = len(calls)
+        if total >= self.minimum_calls and (
+            self._failures / total >= self.error_rate
+            or (self.latency is not None and self._slow / total >= self.slow_rate)
+        ):
+            self._set_state(OPEN, now, changes)
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Call *func* through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        probe = self._before()
+        start = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except self.exceptions:
+            self._after(probe, time.monotonic() - start, True)
+            raise
+        except Exception:
+            self._after(probe, time.monotonic() - start, False)
+            raise
+        except BaseException:
+            # Cancelled or interrupted calls say nothing about the dependency.
+            self._after(probe, time.monotonic() - start, None)
+            raise
+        self._after(probe, time.monotonic() - start, False)
+        return result
+
+    async def call_async(self, func: Awaitable, *args, **kwargs):
+        """
+        Call and await the coroutine function *func* through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        probe = self._before()
+        start = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except self.exceptions:
+            self._after(probe, time.monotonic() - start, True)
+            raise
+        except Exception:
+            self._after(probe, time.monotonic() - start, False)
+            raise
+        except BaseException:
+            # Cancelled or interrupted calls say nothing about the dependency.
+            self._after(probe, time.monotonic() - start, None)
+            raise
+        self._after(probe, time.monotonic() - start, False)
+        return result
+
+    def __call__(self, func: Union[Callable, Awaitable]) -> Union[Callable, Awaitable]:
+        """
+        Use the breaker as decorator for async or sync functions.
+        """
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            return await self.call_async(func, *args, **kwargs)
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+
+        if inspect.iscoroutinefunction(func):
+            wrapper = async_wrapper
+        else:
+            wrapper = sync_wrapper
+        wrapper.breaker = self
+        return wrapper
+
+
+def circuit_breaker(**kwargs) -> Union[Callable, Awaitable]:
+    """
+    Decorate *func* with its own :class:`CircuitBreaker`.
+
+    This decorator works with both asynchronous and synchronous functions. The breaker
+    is available as ``breaker`` attribute of the decorated function. Accepts the same
+    keyword arguments as :class:`CircuitBreaker`.
+
+    Example:
+
+        .. code-block:: python
+
+            from plywoodpirate.functools.circuitbreaker import circuit_breaker
+
+            def report(breaker, old, new):
+                metrics.increment("circuit.{}".format(new))
+
+            @circuit_breaker(error_rate=0.2, window=30, on_state_change=report)
+            async def fetch(session, url):
+                async with session.get(url) as response:
+                    return await response.read()
+
+            print(fetch.breaker.state)  # >>> closed
+    """
+
+    def wrapper(func: Union[Callable, Awaitable]):
+        return CircuitBreaker(**kwargs)(func)
+
+    return wrapper
@@ -0,0 +1,305 @@
+__all__ = ["debounce", "throttle"]
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Awaitable, Callable, List, Tuple, Union
+
+Calls = List[Tuple[tuple, dict]]
+
+
+def _collect(calls: Calls, args: tuple, kwargs: dict, aggregate: bool):
+    """
+    Remember the arguments of a collapsed call.
+    """
+    if aggregate:
+        calls.append((args, kwargs))
+    else:
+        calls[:] = [(args, kwargs)]
+
+
+def _invoke(func: Callable, calls: Calls, aggregate: bool) -> Any:
+    """
+    Call *func* with the latest arguments, or with all collected calls if aggregated.
+    """
+    if aggregate:
+        return func(calls)
+    args, kwargs = calls[-1]
+    return func(*args, **kwargs)
+
+
+async def _resolve(
+    future: asyncio.Future, func: Callable, calls: Calls, aggregate: bool
+):
+    """
+    Await the coalesced invocation and pass its outcome to all collapsed callers.
+    """
+    try:
+        result = await _invoke(func, calls, aggregate)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as err:
+        if not future.done():
+            future.set_exception(err)
+    else:
+        if not future.done():
+            future.set_result(result)
+
+
+def debounce(wait: float, aggregate: bool = False) -> Union[Callable, Awaitable]:
+    """
+    Collapse bursts of calls into one call, ``wait`` seconds after the last call.
+
+    This decorator works with both asynchronous and synchronous functions. Synchronous
+    functions are called from a timer thread and the decorated function returns None
+    immediately. Calls of asynchronous functions are scheduled on the event loop, and
+    all collapsed callers receive the result of the single invocation when awaited.
+
+    The decorated function has a ``cancel()`` method to drop a pending invocation.
+
+    Args:
+        wait: Seconds without calls before *func* is called.
+        aggregate: If True, *func* is called with a single list of the
+            ``(args, kwargs)`` of all collapsed calls instead of the latest arguments.
+
+    Example:
+
+        .. code-block:: python
+
+            from plywoodpirate.functools.coalesce import debounce
+
+            @debounce(wait=0.5, aggregate=True)
+            def invalidate(calls):
+                keys = {args[0] for args, kwargs in calls}
+                cache.invalidate(keys)
+
+            for key in changed_keys:
+                invalidate(key)  # Invalidates all keys at once, 0.5 seconds later.
+    """
+
+    def wrapper(func: Union[Callable, Awaitable]):
+        """
+        Wraps async or sync function with debounce functionality.
+        """
+        lock = threading.Lock()
+        state = {
+            "calls": [],
+            "due": 0.0,
+            "waiting": False,
+            "handle": None,
+            "future": None,
+        }
+
+        def run():
+            while True:
+                with lock:
+                    if not state["calls"]:
+                        state["waiting"] = False
+                        return
+                    remaining = state["due"] - time.monotonic()
+                    if remaining <= 0:
+                        calls, state["calls"] = state["calls"], []
+                        state["waiting"] = False
+                        break
+                time.sleep(remaining)
+            _invoke(func, calls, aggregate)
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            """
+            Leverages a single timer thread per burst, rescheduled on every call.
+            """
+            with lock:
+                _collect(state["calls"], args, kwargs, aggregate)
+                state["due"] = time.monotonic() + wait
+                if not state["waiting"]:
+                    state["waiting"] = True
+                    threading.Thread(target=run, daemon=True).start()
+
+        def fire():
+            calls, state["calls"] = state["calls"], []
+            future, state["future"] = state["future"], None
+            state["handle"] = None
+            asyncio.ensure_future(_resolve(future, func, calls, aggregate))
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            """
+            Leverages loop.call_later() to schedule the call after the burst.
+            """
+            loop = asyncio.get_event_loop()
+            _collect(state["calls"], args, kwargs, aggregate)
+            if state["future"] is None:
+                state["future"] = loop.create_future()
+            if state["handle"] is not None:
+                state["handle"].cancel()
+            state["handle"] = loop.call_later(wait, fire)
+            return await asyncio.shield(state["future"])
+
+        def cancel():
+            """
+            Drop the pending invocation.
+            """
+            with lock:
+                state["calls"] = []
+                if state["handle"] is not None:
+                    state["handle"].cancel()
+                    state["handle"] = None
+                if state["future"] is not None:
+                    state["future"].cancel()
+                    state["future"] = None
+
+        if inspect.iscoroutinefunction(func):
+            async_wrapper.cancel = cancel
+            return async_wrapper
+        else:
+            sync_wrapper.cancel = cancel
+            return sync_wrapper
+
+    return wrapper
+
+
+def throttle(
+    interval: float, trailing: bool = True, aggregate: bool = False
+) -> Union[Callable, Awaitable]:
+    """
+    Call *func* at most once per ``interval`` seconds.
+
+    This decorator works with both asynchronous and synchronous functions. The first
+    call is passed through immediately. Calls within the following ``interval`` are
+    collapsed into one trailing call at the end of the interval, or dropped if
+    ``trailing`` is False.
+
+    Synchronous trailing calls run in a timer thread and collapsed callers receive
+    None. Awaiting a collapsed call of an asynchronous function returns the result
+    of the trailing call, or None if it is dropped.
+
+    The decorated function has a ``cancel()`` method to drop a pending trailing call.
+
+    Args:
+        interval: Minimum seconds between two calls of *func*.
+        trailing: Whether to call *func* with the collapsed calls after the interval.
+        aggregate: If True, *func* is called with a single list of the
+            ``(args, kwargs)`` of all collapsed calls instead of the latest arguments.
+
+    Example:
+
+        .. code-block:: python
+
+            from plywoodpirate.functools.coalesce import throttle
+
+            @throttle(interval=1.0)
+            async def reload_config(path):
+                ...
+    """
+
+    def wrapper(func: Union[Callable, Awaitable]):
+        """
+        Wraps async or sync function with throttle functionality.
+        """
+        lock = threading.Lock()
+        state = {
+            "calls": [],
+            "next": 0.0,
+            "timer": None,
+            "handle": None,
+            "future": None,
+        }
+
+        def admit(args: tuple, kwargs: dict) -> bool:
+            """
+            Whether the call passes now. Otherwise it is collected for the trailing
+            call.
+            """
+            now = time.monotonic()
+            if now >= state["next"] and not state["calls"]:
+                state["next"] = now + interval
+                return True
+            if trailing:
+                _collect(state["calls"], args, kwargs, aggregate)
+            return False
+
+        def take() -> Calls:
+            calls, state["calls"] = state["calls"], []
+            state["next"] = time.monotonic() + interval
+            return calls
+
+        def run():
+            with lock:
+                state["timer"] = None
+                calls = take()
+            if calls:
+                _invoke(func, calls, aggregate)
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            """
+            Leverages a timer thread for the trailing call.
+            """
+            with lock:
+                if admit(args, kwargs):
+                    call_now = True
+                else:
+                    call_now = False
+                    if state["calls"] and state["timer"] is None:
+                        delay = max(0.0, state["next"] - time.monotonic())
+                        state["timer"] = threading.Timer(delay, run)
+                        state["timer"].daemon = True
+                        state["timer"].start()
+
+            if call_now:
+                return _invoke(func, [(args, kwargs)], aggregate)
+
+        def fire():
+            state["handle"] = None
+            future, state["future"] = state["future"], None
+            calls = take()
+            if calls:
+                asyncio.ensure_future(_resolve(future, func, calls, aggregate))
+            else:
+                future.set_result(None)
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            """
+            Leverages loop.call_later() for the trailing call.
+            """
+            if admit(args, kwargs):
+                return await _invoke(func, [(args, kwargs)], aggregate)
+            if not trailing:
+                return None
+
+            loop = asyncio.get_event_loop()
+            if state["future"] is None:
+                state["future"] = loop.create_future()
+                delay = max(0.0, state["next"] - time.monotonic())
+                state["handle"] = loop.call_later(delay, fire)
+            return await asyncio.shield(state["future"])
+
+        def cancel():
+            """
+            Drop the pending trailing call.
+            """
+            with lock:
+                state["calls"] = []
+                if state["timer"] is not None:
+                    state["timer"].cancel()
+                    state["timer"] = None
+                if state["handle"] is not None:
+                    state["handle"].cancel()
+                    state["handle"] = None
+                if state["future"] is not None:
+                    state["future"].cancel()
+                    state["future"] = None
+
+        if inspect.iscoroutinefunction(func):
+            async_wrapper.cancel = cancel
+            return async_wrapper
+        else:
+            sync_wrapper.cancel = cancel
+            return sync_wrapper
+
+    return wrapper
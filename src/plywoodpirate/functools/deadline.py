@@ -0,0 +1,114 @@
+__all__ = ["deadline", "DeadlineExceeded"]
+
+import contextvars
+import datetime
+import time
+from typing import Optional
+
+_deadline: contextvars.ContextVar = contextvars.ContextVar(
+    "plywoodpirate_deadline", default=None
+)
+# Tokens to restore the deadline, as linked ``(token, previous)`` pairs per context, so
+# a shared :class:`deadline` instance may be entered by concurrent tasks.
+_tokens: contextvars.ContextVar = contextvars.ContextVar(
+    "plywoodpirate_deadline_tokens", default=None
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when the time budget of the current context has been used up.
+    """
+
+
+class deadline:
+    def __init__(
+        self,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: float = 0,
+    ):
+        """
+        Context manager that limits the time budget of everything called inside of it.
+
+        The deadline is stored in a :class:`contextvars.ContextVar`, so it follows the
+        code into nested calls, asyncio tasks and functions run with
+        :func:`plywoodpirate.asyncio.threads.to_thread`. Nested deadlines can only
+        shorten the budget, never extend it.
+
+        :func:`plywoodpirate.functools.timeout.timeout`,
+        :func:`plywoodpirate.asyncio.threads.to_thread` and waiters of
+        :func:`plywoodpirate.asyncio.cache.future_lru_cache` honor the deadline and fail
+        fast with :class:`DeadlineExceeded` once it has passed.
+
+        Args:
+            days: Days until the deadline.
+            hours: Hours until the deadline.
+            minutes: Minutes until the deadline.
+            seconds: Seconds until the deadline.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.deadline import deadline
+
+                def handle(request):
+                    with deadline(seconds=2):
+                        query_backend(request)
+
+                def query_backend(request):
+                    deadline.check()    # Raises DeadlineExceeded if the budget is gone.
+                    print(deadline.remaining())  # >>> 1.99...
+        """
+        td = datetime.timedelta(
+            days=days, hours=hours, minutes=minutes, seconds=seconds
+        )
+        self._seconds = td.total_seconds()
+
+    def __enter__(self) -> "deadline":
+        at = time.monotonic() + self._seconds
+        current = _deadline.get()
+        if current is not None and current < at:
+            at = current
+        _tokens.set((_deadline.set(at), _tokens.get()))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        token, previous = _tokens.get()
+        _tokens.set(previous)
+        _deadline.reset(token)
+
+    async def __aenter__(self) -> "deadline":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+    @staticmethod
+    def remaining() -> Optional[float]:
+        """
+        Seconds left until the deadline of the current context, or None without one.
+        """
+        at = _deadline.get()
+        if at is None:
+            return None
+        return at - time.monotonic()
+
+    @staticmethod
+    def expired() -> bool:
+        """
+        Whether the deadline of the current context has passed.
+        """
+        at = _deadline.get()
+        return at is not None and at <= time.monotonic()
+
+    @staticmethod
+    def check():
+        """
+        Raise :class:`DeadlineExceeded` if the deadline of the current context has
+        passed.
+        """
+        if deadline.expired():
+            raise DeadlineExceeded("Deadline of the current context has passed.")
@@ -0,0 +1,161 @@
+__all__ = ["hedge", "LatencyTracker"]
+
+import asyncio
+import collections
+import functools
+import inspect
+import math
+from typing import Awaitable, Callable, Optional
+
+
+class LatencyTracker:
+    def __init__(self, size: int = 1000, refresh: int = 50):
+        """
+        Keeps the latest ``size`` latencies and computes percentiles over them.
+
+        Percentiles are computed from a sorted copy of the samples, which is only
+        refreshed every ``refresh`` new samples to keep recording cheap.
+
+        Args:
+            size: Number of latest samples to keep.
+            refresh: New samples before the sorted copy is refreshed.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.hedge import LatencyTracker
+
+                tracker = LatencyTracker()
+                for latency in (0.01, 0.02, 0.5):
+                    tracker.record(latency)
+
+                print(tracker.percentile(50))  # >>> 0.02
+        """
+        self._samples = collections.deque(maxlen=size)
+        self._refresh = refresh
+        self._sorted = []
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float):
+        """
+        Record a latency in seconds.
+        """
+        self._samples.append(seconds)
+        self._stale += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        The ``q``-th percentile of the recorded latencies, or None without samples.
+        """
+        if self._stale >= self._refresh or not self._sorted:
+            self._sorted = sorted(self._samples)
+            self._stale = 0
+        if not self._sorted:
+            return None
+        index = max(0, math.ceil(q / 100 * len(self._sorted)) - 1)
+        return self._sorted[index]
+
+
+def hedge(
+    after: Optional[float] = None,
+    max_extra: int = 1,
+    percentile: float = 95,
+    min_samples: int = 20,
+    tracker: Optional[LatencyTracker] = None,
+) -> Callable:
+    """
+    Start duplicate attempts of a slow coroutine function to cut tail latency.
+
+    If an attempt has not finished after ``after`` seconds, another attempt is
+    started, up to ``max_extra`` additional attempts. The first successful attempt
+    wins and all others are cancelled. If every attempt fails, the first exception
+    is raised.
+
+    Without ``after``, the delay is the ``percentile`` of the latencies observed by
+    ``tracker``, so only the slowest calls are hedged. Until ``min_samples`` latencies
+    were observed, no attempts are duplicated. The tracker is available as
+    ``tracker`` attribute of the decorated function.
+
+    Hedging is only safe for idempotent calls, e.g. reads against replicated backends.
+
+    Args:
+        after: Seconds before another attempt is started.
+        max_extra: Maximum number of additional attempts.
+        percentile: Percentile of observed latencies used without ``after``.
+        min_samples: Observed latencies needed before hedging without ``after``.
+        tracker: Latency tracker to use. Defaults to a new one per function.
+
+    Example:
+
+        .. code-block:: python
+
+            from plywoodpirate.functools.hedge import hedge
+
+            @hedge(max_extra=2)
+            async def read(key):
+                return await replica().get(key)
+    """
+
+    def wrapper(func: Awaitable):
+        """
+        Wraps async function with hedging.
+        """
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError("Only coroutine functions can be hedged.")
+
+        latencies = tracker if tracker is not None else LatencyTracker()
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if after is not None:
+                delay = after
+            elif len(latencies) >= min_samples:
+                delay = latencies.percentile(percentile)
+            else:
+                delay = None
+
+            loop = asyncio.get_event_loop()
+            start = loop.time()
+            started = [asyncio.ensure_future(func(*args, **kwargs))]
+            pending = set(started)
+            error = None
+
+            try:
+                while pending:
+                    extra = len(started) - 1
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=delay if extra < max_extra else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+
+                    if not done:
+                        task = asyncio.ensure_future(func(*args, **kwargs))
+                        started.append(task)
+                        pending.add(task)
+                        continue
+
+                    for task in done:
+                        if task.cancelled():
+                            continue
+                        if task.exception() is None:
+                            # Latency of the whole call, since the first attempt
+                            # started. The winner's own latency would only record the
+                            # fast attempts and let the percentile drift down.
+                            latencies.record(loop.time() - start)
+                            return task.result()
+                        error = error or task.exception()
+
+                raise error or asyncio.CancelledError()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        async_wrapper.tracker = latencies
+        return async_wrapper
+
+    return wrapper
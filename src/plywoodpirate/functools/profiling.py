@@ -0,0 +1,369 @@
+__all__ = ["profiled", "Histogram", "Profile"]
+
+import contextvars
+import functools
+import inspect
+import math
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, Union
+
+
+class Histogram:
+    def __init__(self, bits: int = 7, highest: int = 2**40):
+        """
+        Fixed-memory histogram of integer values with log-scaled buckets (HDR-style).
+
+        Every power of two is split into ``2 ** bits`` linear buckets, so recorded
+        values keep a relative precision of ``2 ** -bits`` (0.8% by default) over the
+        whole range, with a constant number of buckets. Values above ``highest`` are
+        counted in the last bucket.
+
+        Recording is lock-free and cheap. Concurrent threads may rarely lose a sample,
+        which is fine for profiling.
+
+        Args:
+            bits: Bits of precision per power of two.
+            highest: Highest value tracked precisely. Defaults to about 18 minutes
+                in nanoseconds.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.profiling import Histogram
+
+                histogram = Histogram()
+                for latency in (1000, 2000, 50000):
+                    histogram.record(latency)
+
+                print(histogram.percentile(50))  # >>> 2000
+        """
+        self.bits = bits
+        self.highest = highest
+        self._shift = bits + 1
+        self._size = self._index(highest) + 1
+        self.counts = [0] * self._size
+        self.total = 0
+
+    def _index(self, value: int) -> int:
+        exponent = value.bit_length() - self._shift
+        if exponent <= 0:
+            return value
+        return (exponent << self.bits) + (value >> exponent)
+
+    def _bounds(self, index: int) -> tuple:
+        """
+        Lowest and highest value counted in the bucket at ``index``.
+        """
+        exponent = max(0, (index >> self.bits) - 1)
+        mantissa = index - (exponent << self.bits)
+        return mantissa << exponent, ((mantissa + 1) << exponent) - 1
+
+    def record(self, value: int, count: int = 1):
+        """
+        Record a non-negative integer ``value``, ``count`` times.
+        """
+        exponent = value.bit_length() - self._shift
+        if exponent > 0:
+            index = (exponent << self.bits) + (value >> exponent)
+        else:
+            index = value
+        if index >= self._size:
+            index = self._size - 1
+        self.counts[index] += count
+        self.total += value * count
+
+    @property
+    def count(self) -> int:
+        """
+        Number of recorded values, counted from the buckets to keep recording cheap.
+        """
+        return sum(self.counts)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mean(self) -> Optional[float]:
+        """
+        Exact mean of the recorded values, or None without values.
+        """
+        count = self.count
+        return self.total / count if count else None
+
+    @property
+    def min(self) -> Optional[int]:
+        """
+        Lowest recorded value, within the precision of the histogram.
+        """
+        for index, count in enumerate(self.counts):
+            if count:
+                return self._bounds(index)[0]
+        return None
+
+    @property
+    def max(self) -> Optional[int]:
+        """
+        Highest recorded value, within the precision of the histogram.
+        """
+        for index in range(self._size - 1, -1, -1):
+            if self.counts[index]:
+                return self._bounds(index)[1]
+        return None
+
+    def percentile(self, q: float) -> Optional[int]:
+        """
+        The ``q``-th percentile of the recorded values, or None without values.
+
+        Returns the highest value of the bucket, so the result is never lower than the
+        exact percentile.
+        """
+        recorded = self.count
+        if not recorded:
+            return None
+        rank = max(1, math.ceil(q / 100 * recorded))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self._bounds(index)[1]
+        return self._bounds(self._size - 1)[1]  # pragma: no cover
+
+    def merge(self, other: "Histogram"):
+        """
+        Add the values of ``other``, e.g. from another thread or process.
+
+        Raises:
+            ValueError: If ``other`` uses different buckets.
+        """
+        if other.bits != self.bits or other._size != self._size:
+            raise ValueError("Cannot merge histograms with different buckets.")
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.total += other.total
+
+    def reset(self):
+        """
+        Remove all recorded values.
+        """
+        self.counts[:] = [0] * self._size
+        self.total = 0
+
+    def copy(self) -> "Histogram":
+        histogram = Histogram(self.bits, self.highest)
+        histogram.merge(self)
+        return histogram
+
+
+class Profile:
+    def __init__(self, name: str):
+        """
+        Call count, errors and latency histogram in nanoseconds of a profiled name.
+        """
+        self.name = name
+        self.errors = 0
+        self.histogram = Histogram()
+
+    @property
+    def calls(self) -> int:
+        return self.histogram.count
+
+    def record(self, nanoseconds: int, failed: bool = False):
+        """
+        Record a call that took ``nanoseconds`` and raised if ``failed``.
+        """
+        self.histogram.record(nanoseconds)
+        if failed:
+            self.errors += 1
+
+    def merge(self, other: "Profile"):
+        """
+        Add the calls recorded by ``other``.
+        """
+        self.histogram.merge(other.histogram)
+        self.errors += other.errors
+
+    def reset(self):
+        self.histogram.reset()
+        self.errors = 0
+
+    def copy(self) -> "Profile":
+        profile = Profile(self.name)
+        profile.merge(self)
+        return profile
+
+    def summary(self) -> dict:
+        """
+        Calls, errors and latencies in seconds as dictionary, e.g. to log or export.
+        """
+        histogram = self.histogram
+
+        def seconds(value):
+            return None if value is None else value / 1e9
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total": histogram.total / 1e9,
+            "mean": seconds(histogram.mean),
+            "min": seconds(histogram.min),
+            "p50": seconds(histogram.percentile(50)),
+            "p90": seconds(histogram.percentile(90)),
+            "p99": seconds(histogram.percentile(99)),
+            "max": seconds(histogram.max),
+        }
+
+
+_profiles: Dict[str, Profile] = {}
+_lock = threading.Lock()
+# Start times of entered blocks, as linked ``(start, previous)`` pairs per context, so a
+# shared :class:`profiled` instance may be entered by concurrent tasks and threads.
+_starts: contextvars.ContextVar = contextvars.ContextVar(
+    "plywoodpirate_profiled_starts", default=None
+)
+
+
+def _profile(name: str) -> Profile:
+    profile = _profiles.get(name)
+    if profile is None:
+        with _lock:
+            profile = _profiles.setdefault(name, Profile(name))
+    return profile
+
+
+class profiled:
+    def __init__(self, name: Optional[str] = None):
+        """
+        Record calls, errors and latencies of a function or code block under ``name``.
+
+        Use it as decorator for synchronous and asynchronous functions, or as context
+        manager. Latencies are measured with :func:`time.perf_counter_ns` and recorded
+        in a fixed-memory :class:`Histogram` per name, so it is cheap enough to stay
+        enabled in production. Calls that raise count as errors. One instance may be
+        entered by concurrent tasks and threads.
+
+        Args:
+            name: Name to record under. Defaults to the qualified name of the decorated
+                function.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.profiling import profiled
+
+                @profiled()
+                async def handle(request):
+                    with profiled("handle.query"):
+                        rows = await query(request)
+                    ...
+
+                stats = profiled.snapshot()
+                print(stats["handle.query"].summary()["p99"])  # >>> 0.0123
+                profiled.reset()
+        """
+        self._name = name
+
+    def __enter__(self) -> "profiled":
+        if self._name is None:
+            raise ValueError("profiled needs a name when used as context manager.")
+        _starts.set((time.perf_counter_ns(), _starts.get()))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        start, previous = _starts.get()
+        _starts.set(previous)
+        elapsed = time.perf_counter_ns() - start
+        _profile(self._name).record(elapsed, exc_type is not None)
+
+    async def __aenter__(self) -> "profiled":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+    def __call__(self, func: Union[Callable, Awaitable]) -> Union[Callable, Awaitable]:
+        """
+        Wraps async or sync function with profiling.
+        """
+        name = self._name or "{}.{}".format(func.__module__, func.__qualname__)
+        profile = _profile(name)
+        histogram = profile.histogram
+        # The bucket of Histogram.record() is computed inline, which saves a method
+        # call per call. reset() and merge() update ``counts`` in place.
+        counts = histogram.counts
+        bits, shift, last = histogram.bits, histogram._shift, histogram._size - 1
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return await func(*args, **kwargs)
+            except BaseException:
+                profile.errors += 1
+                raise
+            finally:
+                value = clock() - start
+                exponent = value.bit_length() - shift
+                if exponent > 0:
+                    index = (exponent << bits) + (value >> exponent)
+                else:
+                    index = value
+                counts[index if index < last else last] += 1
+                histogram.total += value
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                profile.errors += 1
+                raise
+            finally:
+                value = clock() - start
+                exponent = value.bit_length() - shift
+                if exponent > 0:
+                    index = (exponent << bits) + (value >> exponent)
+                else:
+                    index = value
+                counts[index if index < last else last] += 1
+                histogram.total += value
+
+        if inspect.iscoroutinefunction(func):
+            return async_wrapper
+        else:
+            return sync_wrapper
+
+    @staticmethod
+    def snapshot() -> Dict[str, Profile]:
+        """
+        Copies of the profiles of all names, that are not affected by later calls.
+        """
+        with _lock:
+            profiles = list(_profiles.values())
+        return {profile.name: profile.copy() for profile in profiles}
+
+    @staticmethod
+    def reset(name: Optional[str] = None):
+        """
+        Remove the recorded calls of ``name``, or of all names.
+        """
+        with _lock:
+            profiles = list(_profiles.values())
+        for profile in profiles:
+            if name is None or profile.name == name:
+                profile.reset()
+
+    @staticmethod
+    def merge(snapshot: Dict[str, Profile]):
+        """
+        Add the calls of a snapshot, e.g. from a worker process, to the current
+        profiles.
+        """
+        for name, profile in snapshot.items():
+            _profile(name).merge(profile)
@@ -0,0 +1,344 @@
+__all__ = ["TokenBucket", "SlidingWindow", "RateLimitExceeded", "rate_limit"]
+
+import asyncio
+import collections
+import functools
+import inspect
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+from .deadline import DeadlineExceeded, deadline
+
+
+class RateLimitExceeded(RuntimeError):
+    """
+    Raised by non-blocking rate limited functions when no capacity is left.
+    """
+
+
+class _Limiter(ABC):
+    """
+    Common interface of all rate limiters.
+
+    Waiting callers reserve their share of the capacity up front and then sleep for
+    exactly the time until it becomes available, instead of polling. Every ``key``
+    gets its own independent limit. Keys whose limit is back to its initial state are
+    dropped whenever the number of keys has doubled, so short-lived keys don't pile up.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states = {}
+        self._sweep_at = 64
+
+    @abstractmethod
+    def _reserve(
+        self, key: Hashable, tokens: int, now: float, wait: bool
+    ) -> Optional[Any]:
+        """
+        Reserve ``tokens`` and return (delay, reservation), or None if ``wait`` is
+        False and the tokens are not available right away.
+        """
+
+    @abstractmethod
+    def _refund(self, key: Hashable, reservation: Any):
+        """
+        Return a reservation that is not used.
+        """
+
+    @abstractmethod
+    def _idle(self, state: Any, now: float) -> bool:
+        """
+        Whether ``state`` is equal to the initial state of a key and may be dropped.
+        """
+
+    def _sweep(self, now: float):
+        """
+        Drop the states of idle keys, once the number of keys has doubled.
+        """
+        if len(self._states) < self._sweep_at:
+            return
+        for key in [k for k, state in self._states.items() if self._idle(state, now)]:
+            del self._states[key]
+        self._sweep_at = max(64, 2 * len(self._states))
+
+    def try_acquire(self, key: Hashable = None, tokens: int = 1) -> bool:
+        """
+        Acquire ``tokens`` if they are available right now, without waiting.
+
+        Args:
+            key: Key of the limit to acquire from.
+            tokens: Number of tokens to acquire.
+
+        Returns:
+            Whether the tokens were acquired.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._sweep(now)
+            return self._reserve(key, tokens, now, False) is not None
+
+    def _delay(self, key: Hashable, tokens: int) -> tuple:
+        with self._lock:
+            now = time.monotonic()
+            self._sweep(now)
+            delay, reservation = self._reserve(key, tokens, now, True)
+
+        remaining = deadline.remaining()
+        if remaining is not None and delay > remaining:
+            with self._lock:
+                self._refund(key, reservation)
+            raise DeadlineExceeded("Rate limit would delay the call past the deadline.")
+
+        return delay, reservation
+
+    def acquire(self, key: Hashable = None, tokens: int = 1):
+        """
+        Acquire ``tokens``, sleeping until they are available.
+
+        Raises:
+            DeadlineExceeded: If the tokens become available after the deadline of the
+                current context.
+        """
+        delay, _ = self._delay(key, tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, key: Hashable = None, tokens: int = 1):
+        """
+        Acquire ``tokens``, sleeping asynchronously until they are available.
+
+        Raises:
+            DeadlineExceeded: If the tokens become available after the deadline of the
+                current context.
+        """
+        delay, reservation = self._delay(key, tokens)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                with self._lock:
+                    self._refund(key, reservation)
+                raise
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def __call__(self, func: Union[Callable, Awaitable]) -> Union[Callable, Awaitable]:
+        """
+        Use the limiter itself as decorator with a single shared limit.
+        """
+        return rate_limit(self)(func)
+
+
+class TokenBucket(_Limiter):
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Rate limiter that refills ``rate`` tokens per second, up to ``capacity`` tokens.
+
+        Bursts of up to ``capacity`` calls are allowed, after that calls are spaced
+        ``1 / rate`` seconds apart.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens. Defaults to ``rate``.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.ratelimit import TokenBucket
+
+                bucket = TokenBucket(rate=10, capacity=20)
+
+                @bucket
+                def func():
+                    ...
+
+                with bucket:
+                    ...
+
+                if bucket.try_acquire(key="partner-a"):
+                    ...
+        """
+        super().__init__()
+        self._rate = rate
+        self._capacity = rate if capacity is None else capacity
+
+    def _reserve(self, key, tokens, now, wait):
+        if tokens > self._capacity:
+            raise ValueError(
+                "Cannot acquire more tokens than the capacity of the bucket."
+            )
+
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = [self._capacity, now]
+
+        available = min(self._capacity, state[0] + (now - state[1]) * self._rate)
+        state[1] = now
+        if available < tokens and not wait:
+            state[0] = available
+            return None
+
+        # A negative level is a reservation of tokens that are not refilled yet.
+        state[0] = available - tokens
+        return max(0.0, -state[0] / self._rate), tokens
+
+    def _refund(self, key, reservation):
+        state = self._states.get(key)
+        if state is not None:
+            state[0] = min(self._capacity, state[0] + reservation)
+
+    def _idle(self, state, now):
+        return state[0] + (now - state[1]) * self._rate >= self._capacity
+
+
+class SlidingWindow(_Limiter):
+    def __init__(self, limit: int, period: float):
+        """
+        Rate limiter that allows ``limit`` calls within any ``period`` seconds.
+
+        The timestamps of the calls within the window are logged, so the limit is
+        exact, at the cost of memory for ``limit`` timestamps per key.
+
+        Args:
+            limit: Maximum number of calls per period.
+            period: Length of the window in seconds.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.ratelimit import SlidingWindow, rate_limit
+
+                window = SlidingWindow(limit=100, period=60)
+
+                @rate_limit(window, key=lambda partner, *args: partner)
+                async def call_partner(partner, payload):
+                    ...
+        """
+        super().__init__()
+        self._limit = limit
+        self._period = period
+
+    def _reserve(self, key, tokens, now, wait):
+        if tokens > self._limit:
+            raise ValueError("Cannot acquire more tokens than the limit of the window.")
+
+        log = self._states.get(key)
+        if log is None:
+            log = self._states[key] = collections.deque()
+
+        while log and log[0] <= now - self._period:
+            log.popleft()
+
+        # Timestamps in the future are reservations of waiting callers.
+        slots = []
+        for _ in range(tokens):
+            at = log[-1] if log and log[-1] > now else now
+            index = len(log) + len(slots) - self._limit
+            if index >= 0:
+                oldest = log[index] if index < len(log) else slots[index - len(log)]
+                at = max(at, oldest + self._period)
+            if slots:
+                at = max(at, slots[-1])
+            slots.append(at)
+
+        if slots[-1] > now and not wait:
+            return None
+
+        log.extend(slots)
+        return slots[-1] - now, slots
+
+    def _refund(self, key, reservation):
+        log = self._states.get(key, ())
+        for at in reservation:
+            try:
+                log.remove(at)
+            except ValueError:
+                pass
+
+    def _idle(self, state, now):
+        return not state or state[-1] <= now - self._period
+
+
+def rate_limit(
+    limiter: _Limiter,
+    key: Optional[Callable[..., Hashable]] = None,
+    tokens: int = 1,
+    block: bool = True,
+) -> Union[Callable, Awaitable]:
+    """
+    Limit how often *func* is called.
+
+    This decorator works with both asynchronous and synchronous functions. Synchronous
+    functions sleep in the calling thread and asynchronous functions sleep with
+    ``asyncio.sleep()`` until the limiter has capacity.
+
+    Args:
+        limiter: The :class:`TokenBucket` or :class:`SlidingWindow` to acquire from.
+        key: Function that receives the arguments of *func* and returns the key of
+            the limit to use. All calls share one limit by default.
+        tokens: Tokens to acquire per call.
+        block: Whether to wait for capacity, or to raise :class:`RateLimitExceeded`.
+
+    Example:
+
+        .. code-block:: python
+
+            from plywoodpirate.functools.ratelimit import TokenBucket, rate_limit
+
+            @rate_limit(TokenBucket(rate=5), key=lambda url: url.split("/")[2])
+            def fetch(url):
+                return requests.get(url)
+    """
+
+    def wrapper(func: Union[Callable, Awaitable]):
+        """
+        Wraps async or sync function with rate limiting.
+        """
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            k = key(*args, **kwargs) if key else None
+            if not block:
+                if not limiter.try_acquire(k, tokens):
+                    raise RateLimitExceeded(
+                        "Rate limit of function {} exceeded.".format(func.__name__)
+                    )
+            else:
+                await limiter.acquire_async(k, tokens)
+            return await func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            k = key(*args, **kwargs) if key else None
+            if not block:
+                if not limiter.try_acquire(k, tokens):
+                    raise RateLimitExceeded(
+                        "Rate limit of function {} exceeded.".format(func.__name__)
+                    )
+            else:
+                limiter.acquire(k, tokens)
+            return func(*args, **kwargs)
+
+        if inspect.iscoroutinefunction(func):
+            return async_wrapper
+        else:
+            return sync_wrapper
+
+    return wrapper
@@ -0,0 +1,248 @@
+__all__ = ["retry", "RetryBudget"]
+
+import asyncio
+import functools
+import inspect
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type, Union
+
+from .deadline import deadline
+
+ExceptionFilter = Union[
+    Type[BaseException],
+    Tuple[Type[BaseException], ...],
+    Callable[[BaseException], bool],
+]
+
+
+class RetryBudget:
+    def __init__(self, max_tokens: float = 10, token_ratio: float = 0.1):
+        """
+        Limits retries to a ratio of successful calls, shared by all functions using it.
+
+        Every failed attempt removes a token and every successful call adds
+        ``token_ratio`` tokens, up to ``max_tokens``. Retries are only allowed while
+        more than half of ``max_tokens`` are left. When most calls fail, e.g. during an
+        outage of a dependency, retries stop until calls succeed again, so they do not
+        multiply the load on the failing dependency.
+
+        Args:
+            max_tokens: Size of the budget.
+            token_ratio: Tokens added per successful call, i.e. the ratio of retries
+                to successful calls that is sustained.
+
+        Example:
+
+            .. code-block:: python
+
+                from plywoodpirate.functools.retry import RetryBudget, retry
+
+                budget = RetryBudget(max_tokens=100, token_ratio=0.2)
+
+                @retry(attempts=5, budget=budget)
+                def func():
+                    ...
+        """
+        self._max_tokens = max_tokens
+        self._token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Tokens that are currently left.
+        """
+        return self._tokens
+
+    def can_retry(self) -> bool:
+        """
+        Whether the budget currently allows a retry.
+        """
+        return self._tokens > self._max_tokens / 2
+
+    def record_success(self):
+        """
+        Record a successful call.
+        """
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._token_ratio)
+
+    def record_failure(self):
+        """
+        Record a failed attempt.
+        """
+        with self._lock:
+            self._tokens = max(0, self._tokens - 1)
+
+
+_default_budget = RetryBudget()
+
+
+class _Policy:
+    """
+    Decides whether and when to retry. Shared by the sync and async wrappers.
+    """
+
+    def __init__(self, attempts, backoff, cap, max_elapsed, budget):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.cap = cap
+        self.max_elapsed = max_elapsed
+        self.budget = budget
+
+    def success(self):
+        if self.budget is not None:
+            self.budget.record_success()
+
+    def delay(self, attempt: int, start: float) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None to give up.
+        """
+        if self.budget is not None:
+            self.budget.record_failure()
+            if not self.budget.can_retry():
+                return None
+
+        if attempt + 1 >= self.attempts:
+            return None
+
+        # Exponential backoff with full jitter.
+        delay = random.uniform(0, min(self.cap, self.backoff * 2**attempt))
+
+        elapsed = time.monotonic() - start
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+
+        remaining = deadline.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+
+        return delay
+
+
+def retry(
+    exceptions: ExceptionFilter = Exception,
+    result: Optional[Callable[[Any], bool]] = None,
+    attempts: int = 3,
+    backoff: float = 0.1,
+    cap: float = 10.0,
+    max_elapsed: Optional[float] = None,
+    budget: Optional[RetryBudget] = _default_budget,
+) -> Union[Callable, Awaitable]:
+    """
+    Retry *func* with exponential backoff and full jitter.
+
+    This decorator works with both asynchronous and synchronous functions. Before
+    attempt ``n`` (starting at 0 for the first retry), it waits a random time between
+    0 and ``min(cap, backoff * 2 ** n)`` seconds.
+
+    It gives up once ``attempts`` are used, the next attempt would start after
+    ``max_elapsed`` seconds or after the current
+    :class:`plywoodpirate.functools.deadline.deadline`, or the :class:`RetryBudget`
+    is used up. All decorated functions share one process-wide budget by default.
+    When giving up, the last exception is raised or the last result is returned.
+
+    Args:
+        exceptions: Exception types to retry on, or a predicate that receives the
+            exception and returns True to retry.
+        result: Predicate that receives the return value and returns True to retry.
+        attempts: Maximum number of attempts, including the first one.
+        backoff: Base delay of the exponential backoff in seconds.
+        cap: Maximum delay between attempts in seconds.
+        max_elapsed: Maximum time in seconds to spend on all attempts.
+        budget: Retry budget to use. None disables the budget.
+
+    Example:
+
+        .. code-block:: python
+
+            from plywoodpirate.functools.retry import retry
+
+            @retry(exceptions=ConnectionError, result=lambda r: r.status_code >= 500)
+            def fetch(url):
+                return requests.get(url)
+
+            fetch("https://example.com")
+    """
+
+    policy = _Policy(attempts, backoff, cap, max_elapsed, budget)
+
+    if inspect.isclass(exceptions) or isinstance(exceptions, tuple):
+        types = exceptions
+
+        def retry_exception(err: BaseException) -> bool:
+            return isinstance(err, types)
+
+    else:
+        retry_exception = exceptions
+
+    def wrapper(func: Union[Callable, Awaitable]):
+        """
+        Wraps async or sync function with retry functionality.
+        """
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            """
+            Leverages the asyncio.sleep() function to wait between attempts.
+            """
+
+            start = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    value = await func(*args, **kwargs)
+                except Exception as err:
+                    if not retry_exception(err):
+                        raise
+                    delay = policy.delay(attempt, start)
+                    if delay is None:
+                        raise
+                else:
+                    if result is None or not result(value):
+                        policy.success()
+                        return value
+                    delay = policy.delay(attempt, start)
+                    if delay is None:
+                        return value
+
+                await asyncio.sleep(delay)
+                attempt += 1
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            """
+            Leverages the time.sleep() function to wait between attempts.
+            """
+
+            start = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    value = func(*args, **kwargs)
+                except Exception as err:
+                    if not retry_exception(err):
+                        raise
+                    delay = policy.delay(attempt, start)
+                    if delay is None:
+                        raise
+                else:
+                    if result is None or not result(value):
+                        policy.success()
+                        return value
+                    delay = policy.delay(attempt, start)
+                    if delay is None:
+                        return value
+
+                time.sleep(delay)
+                attempt += 1
+
+        if inspect.iscoroutinefunction(func):
+            return async_wrapper
+        else:
+            return sync_wrapper
+
+    return wrapper
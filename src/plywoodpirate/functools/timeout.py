@@ -1,26 +1,311 @@
 __all__ = ["timeout"]
 
 import asyncio
+import ctypes
 import datetime
 import functools
+import heapq
 import inspect
+import itertools
+import math
 import signal
-from typing import Awaitable, Callable, Union
+import threading
+import time
+from typing import Awaitable, Callable, List, Optional, Union
+
+from .deadline import DeadlineExceeded, deadline
+
+# Interval timers may fire slightly before the monotonic deadline.
+_RESOLUTION = 1e-3
+
+
+class _Expired(TimeoutError):
+    """
+    Raised inside the guarded code once the deadline of ``scope`` has passed.
+    """
+
+    scope = None
+
+
+class _ThreadExpired(_Expired):
+    """
+    Raised asynchronously by the watchdog. The expired scope is noted per thread.
+    """
+
+
+class _Scope:
+    """
+    Deadline of a single call of a synchronous function decorated with :func:`timeout`.
+    """
+
+    def __init__(self, seconds: float):
+        self.deadline = time.monotonic() + seconds
+        self.done = False
+        self.expired = False
+
+    def close(self):
+        """
+        Disarm the scope. Must be safe to call more than once.
+        """
+        self.done = True
+
+
+class _SignalScope(_Scope):
+    """
+    Scope on the main thread, interrupted by ``SIGALRM`` via ``signal.setitimer()``.
+
+    All active scopes share one interval timer, which is always armed for the earliest
+    deadline. The handler and timer that were installed before the outermost scope
+    was entered are restored once it is closed.
+    """
+
+    stack: List["_SignalScope"] = []
+    saved = None
+
+    def __init__(self, seconds: float):
+        super().__init__(seconds)
+        stack = _SignalScope.stack
+        if not stack:
+            handler = signal.signal(signal.SIGALRM, _SignalScope.on_alarm)
+            delay, interval = signal.setitimer(signal.ITIMER_REAL, 0)
+            _SignalScope.saved = (handler, delay, interval, time.monotonic())
+        stack.append(self)
+        _SignalScope.arm()
+
+    @staticmethod
+    def arm():
+        deadlines = [s.deadline for s in _SignalScope.stack if not s.done]
+        handler, delay, _, started = _SignalScope.saved
+        if delay:
+            deadlines.append(started + delay)
+        if deadlines:
+            remaining = max(min(deadlines) - time.monotonic(), _RESOLUTION)
+            signal.setitimer(signal.ITIMER_REAL, remaining)
+
+    @staticmethod
+    def on_alarm(signum, frame):
+        now = time.monotonic() + _RESOLUTION
+        # The outermost expired scope wins, inner scopes are unwound with it.
+        for scope in _SignalScope.stack:
+            if not scope.done and not scope.expired and scope.deadline <= now:
+                scope.expired = True
+                _SignalScope.arm()
+                err = _Expired()
+                err.scope = scope
+                raise err
+
+        handler, delay, interval, started = _SignalScope.saved
+        if delay and started + delay <= now:
+            # The timer that was armed before the first scope is due.
+            _SignalScope.saved = (handler, interval, interval, now)
+            _SignalScope.arm()
+            if callable(handler):
+                handler(signum, frame)
+        else:
+            _SignalScope.arm()
+
+    def close(self):
+        if self.done:
+            return
+        self.done = True
+
+        stack = _SignalScope.stack
+        while stack and stack[-1].done:
+            stack.pop()
+        if stack:
+            _SignalScope.arm()
+            return
+
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        handler, delay, interval, started = _SignalScope.saved
+        signal.signal(signal.SIGALRM, signal.SIG_DFL if handler is None else handler)
+        if delay:
+            remaining = delay - (time.monotonic() - started)
+            if remaining > 0:
+                signal.setitimer(signal.ITIMER_REAL, remaining, interval)
+            elif interval:
+                signal.setitimer(signal.ITIMER_REAL, interval, interval)
+
+
+def _set_async_exc(thread_id: int, exc: Optional[type]) -> int:
+    """
+    Raise ``exc`` asynchronously in thread ``thread_id``, or clear it if ``None``.
+    """
+    return ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id),
+        ctypes.py_object(exc) if exc is not None else ctypes.c_void_p(0),
+    )
+
+
+class _Watchdog(threading.Thread):
+    """
+    Single daemon thread that interrupts expired :class:`_ThreadScope` instances.
+
+    Closed scopes are removed lazily. Once they make up half of the heap, it is
+    compacted, so scopes that finish long before their deadline don't pile up.
+    """
+
+    def __init__(self):
+        super().__init__(name="plywoodpirate-timeout", daemon=True)
+        self._heap = []
+        self._closed = 0
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+    def watch(self, scope: "_ThreadScope"):
+        with self._condition:
+            heapq.heappush(self._heap, (scope.deadline, next(self._counter), scope))
+            scope.watched = True
+            if self._heap[0][2] is scope:
+                self._condition.notify()
+
+    def discard(self, scope: "_ThreadScope"):
+        with self._condition:
+            if not scope.watched:
+                return
+            scope.watched = False
+            self._closed += 1
+            if self._closed > 64 and self._closed * 2 > len(self._heap):
+                heap = []
+                for entry in self._heap:
+                    if entry[2].done:
+                        entry[2].watched = False
+                    else:
+                        heap.append(entry)
+                heapq.heapify(heap)
+                self._heap = heap
+                self._closed = 0
+
+    def run(self):
+        with self._condition:
+            while True:
+                while self._heap and self._heap[0][2].done:
+                    scope = heapq.heappop(self._heap)[2]
+                    if scope.watched:
+                        scope.watched = False
+                    else:
+                        self._closed -= 1
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                deadline, _, scope = self._heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+
+                heapq.heappop(self._heap)
+                scope.watched = False
+                scope.interrupt()
+
+
+class _ThreadScope(_Scope):
+    """
+    Scope on any thread, interrupted by raising an exception asynchronously.
+
+    The exception is raised once the thread executes Python bytecode again, so blocking
+    calls into C code (e.g. ``time.sleep()``) finish before the function is interrupted.
+    Interpreters without ``ctypes.pythonapi`` are not interrupted at all and the
+    function is reported as timed out after it returns.
+    """
+
+    watchdog: Optional[_Watchdog] = None
+    lock = threading.Lock()
+    local = threading.local()
+
+    def __init__(self, seconds: float):
+        super().__init__(seconds)
+        self.thread_id = threading.get_ident()
+        self.fired = False
+        self.raised = False
+        self.watched = False
+        self._lock = threading.Lock()
+        # Only a class can be raised asynchronously, so the scope that fired is noted
+        # in a slot of the thread, which :meth:`expired_scope` reads.
+        self._slot = _ThreadScope.slot()
+
+        if hasattr(ctypes, "pythonapi"):
+            with _ThreadScope.lock:
+                if _ThreadScope.watchdog is None:
+                    _ThreadScope.watchdog = _Watchdog()
+                    _ThreadScope.watchdog.start()
+            _ThreadScope.watchdog.watch(self)
+
+    @staticmethod
+    def slot() -> list:
+        slot = getattr(_ThreadScope.local, "slot", None)
+        if slot is None:
+            slot = _ThreadScope.local.slot = [None]
+        return slot
+
+    @staticmethod
+    def expired_scope() -> Optional["_ThreadScope"]:
+        """
+        Take the scope whose exception was raised last in the current thread.
+        """
+        slot = _ThreadScope.slot()
+        scope, slot[0] = slot[0], None
+        return scope
+
+    def interrupt(self):
+        with self._lock:
+            if not self.done:
+                self.fired = self.expired = True
+                self._slot[0] = self
+                _set_async_exc(self.thread_id, _ThreadExpired)
+
+    def close(self):
+        with self._lock:
+            if self.done:
+                return
+            self.done = True
+            if self.fired and not self.raised:
+                # The exception is still pending, so it must not leak into the caller.
+                if self._slot[0] is self:
+                    _set_async_exc(self.thread_id, None)
+            elif not hasattr(ctypes, "pythonapi"):
+                self.expired = time.monotonic() >= self.deadline
+        if self.watched:
+            _ThreadScope.watchdog.discard(self)
+
+
+def _open_scope(seconds: float) -> _Scope:
+    """
+    Create the scope that fits the current thread.
+    """
+    if (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    ):
+        return _SignalScope(seconds)
+    return _ThreadScope(seconds)
 
 
 def timeout(
     days: int = 0,
     hours: int = 0,
     minutes: int = 0,
-    seconds: int = 0,
+    seconds: float = 0,
     error: bool = False,
 ) -> Union[Callable, Awaitable]:
     """
     Wait for *time* before quitting *func* run and returning None.
 
-    This decorator works with both asynchronous and synchronous functions. Note,
-    however, that with synchronous function the *signal* module is used and
-    therefore will not work with non-Unix based systems.
+    This decorator works with both asynchronous and synchronous functions. Timeouts
+    may be fractions of a second and decorated functions may be nested.
+
+    On the main thread of Unix based systems, synchronous functions are interrupted
+    with ``SIGALRM`` through ``signal.setitimer()``. The previously installed handler
+    and timer are restored afterwards. On any other thread, the function is
+    interrupted by raising an exception in that thread from a watchdog thread, which
+    takes effect once the thread executes Python code again. Blocking calls, like
+    ``time.sleep()``, are therefore only interrupted on the main thread.
+
+    The timeout is also applied as :class:`plywoodpirate.functools.deadline.deadline`
+    to everything *func* calls, and it is shortened to the remaining time of an outer
+    deadline. If that deadline has already passed, *func* is not called at all. A
+    timeout of zero disables the timeout.
 
     Args:
         days: Days to wait before timeout.
@@ -35,7 +320,7 @@ def timeout(
 
             from plywoodpirate.functools.timeout import timeout
 
-            @timeout(seconds=5)
+            @timeout(seconds=0.5)
             def func():
                 time.wait(15)
 
@@ -43,7 +328,26 @@ def timeout(
     """
 
     td = datetime.timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
-    total_seconds = int(td.total_seconds())
+    total_seconds = td.total_seconds()
+    # Like ``signal.alarm(0)``, a timeout of zero disables the timeout.
+    limit = total_seconds if total_seconds > 0 else math.inf
+
+    def budget(func: Callable, limit: float) -> Optional[float]:
+        """
+        Seconds *func* may run, or None if the deadline of the context has passed.
+        """
+        remaining = deadline.remaining()
+        if remaining is None:
+            return limit
+        if remaining <= 0:
+            if error:
+                raise DeadlineExceeded(
+                    "Deadline passed before function {} was called.".format(
+                        func.__name__
+                    )
+                )
+            return None
+        return min(limit, remaining)
 
     def wrapper(func: Union[Callable, Awaitable]):
         """
@@ -56,8 +360,15 @@ def timeout(
             Leverages the asyncio.wait_for() function to wait for a given amount of time.
             """
 
+            seconds = budget(func, limit)
+            if seconds is None:
+                return None
+            if seconds == math.inf:
+                return await func(*args, **kwargs)
+
             try:
-                return await asyncio.wait_for(func(*args, **kwargs), total_seconds)
+                with deadline(seconds=seconds):
+                    return await asyncio.wait_for(func(*args, **kwargs), seconds)
             except asyncio.TimeoutError as err:
                 if error:
                     raise TimeoutError(
@@ -67,21 +378,40 @@ def timeout(
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             """
-            Leverages the signal.alarm() function to wait for a given amount of time.
+            Runs the function in a timeout scope, which interrupts it after the
+            deadline.
             """
 
-            def _handle_timeout(signum, frame):
-                raise TimeoutError
+            seconds = budget(func, limit)
+            if seconds is None:
+                return None
+            if seconds == math.inf:
+                return func(*args, **kwargs)
 
-            signal.signal(signal.SIGALRM, _handle_timeout)
-            signal.alarm(total_seconds)
+            scope = _open_scope(seconds)
             try:
-                return func(*args, **kwargs)
-            except TimeoutError as err:
+                try:
+                    with deadline(seconds=seconds):
+                        result = func(*args, **kwargs)
+                finally:
+                    scope.close()
+            except _Expired as err:
+                if isinstance(err, _ThreadExpired) and err.scope is None:
+                    err.scope = _ThreadScope.expired_scope()
+                if err.scope is not scope:
+                    scope.close()
+                    raise
+                scope.raised = True
+                scope.close()
                 if error:
                     raise TimeoutError(
                         "Function {} timed out.".format(func.__name__)
                     ) from err
+                return None
+
+            if scope.expired and error:
+                raise TimeoutError("Function {} timed out.".format(func.__name__))
+            return None if scope.expired else result
 
         if inspect.iscoroutinefunction(func):
             return async_wrapper
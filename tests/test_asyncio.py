@@ -1,10 +1,21 @@
 import asyncio
+import functools
+import time
+import zlib
 from typing import Callable, Optional
 
 import pytest
 
-from plywoodpirate.asyncio import CoroutineClass, awaitable, tls_handshake, to_thread
+from plywoodpirate.asyncio import (
+    CompressedStreamReader,
+    CoroutineClass,
+    awaitable,
+    compress_streams,
+    tls_handshake,
+    to_thread,
+)
 from plywoodpirate.asyncio.cache import future_lru_cache
+from plywoodpirate.functools import DeadlineExceeded, deadline
 
 
 class Test_cache:
@@ -18,6 +29,35 @@ class Test_cache:
         await asyncio.wait_for(func(), timeout=3)
         await asyncio.wait_for(func(), timeout=1)
 
+    @pytest.mark.asyncio
+    async def test_future_lru_cache_deadline(self):
+        @future_lru_cache
+        async def func():
+            await asyncio.sleep(0.5)
+            return 42
+
+        task = func()
+        with deadline(seconds=0.1):
+            with pytest.raises(DeadlineExceeded):
+                await func()
+        assert await task == 42
+
+        with deadline(seconds=0):
+            with pytest.raises(DeadlineExceeded):
+                await func(1)
+
+    @pytest.mark.asyncio
+    async def test_future_lru_cache_deadline_first_caller(self):
+        @future_lru_cache
+        async def func():
+            await asyncio.sleep(0.5)
+            return 42
+
+        with deadline(seconds=0.1):
+            with pytest.raises(DeadlineExceeded):
+                await func()
+        assert await func() == 42
+
 
 class Test_patterns:  # pylint: disable=protected-access
     class CC(CoroutineClass):
@@ -121,6 +161,80 @@ class Test_streams:
         await writer.wait_closed()
 
 
+class Test_compression:
+    async def roundtrip(self, algorithm, payload, **kwargs):
+        async def echo(reader, writer):
+            creader, cwriter = compress_streams(reader, writer, algorithm, **kwargs)
+            await cwriter.write(await creader.read())
+            await cwriter.close()
+
+        server = await asyncio.start_server(echo, host="127.0.0.1", port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            creader, cwriter = compress_streams(reader, writer, algorithm, **kwargs)
+            await cwriter.write(payload)
+            await cwriter.write_eof()
+            data = await creader.read()
+            writer.close()
+            await writer.wait_closed()
+        return data
+
+    @pytest.mark.asyncio
+    async def test_compression_roundtrip(self):
+        payload = b"hello world " * 50000
+        for algorithm in ("zlib", "gzip", "lzma"):
+            assert await self.roundtrip(algorithm, payload) == payload
+
+    @pytest.mark.asyncio
+    async def test_compression_small_buffers(self):
+        payload = bytes(range(256)) * 1000
+        data = await self.roundtrip("zlib", payload, limit=1024, offload=None)
+        assert data == payload
+
+    @pytest.mark.asyncio
+    async def test_compression_flush(self):
+        async def echo(reader, writer):
+            creader, cwriter = compress_streams(reader, writer, "gzip")
+            await cwriter.write(await creader.readexactly(5), flush=True)
+            await cwriter.close()
+
+        server = await asyncio.start_server(echo, host="127.0.0.1", port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            creader, cwriter = compress_streams(reader, writer, "gzip")
+            await cwriter.write(b"hello", flush=True)
+            assert await creader.readexactly(5) == b"hello"
+            await cwriter.close()
+
+    @pytest.mark.asyncio
+    async def test_compression_truncated(self):
+        payload = b",".join(b"%d" % i for i in range(10000))
+        for read in (lambda r: r.read(), lambda r: r.readexactly(len(payload))):
+            reader = asyncio.StreamReader()
+            reader.feed_data(zlib.compress(payload)[:1000])
+            reader.feed_eof()
+            with pytest.raises(asyncio.IncompleteReadError) as exc:
+                await read(CompressedStreamReader(reader))
+            assert exc.value.partial and payload.startswith(exc.value.partial)
+
+    @pytest.mark.asyncio
+    async def test_compression_at_eof(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(zlib.compress(b"a" * 10000))
+        reader.feed_eof()
+        creader = CompressedStreamReader(reader, limit=1024)
+        assert await creader.read(1024) == b"a" * 1024
+        assert reader.at_eof() and not creader.at_eof()
+        assert await creader.read() == b"a" * (10000 - 1024)
+        assert creader.at_eof()
+
+    def test_compression_algorithm_err(self):
+        with pytest.raises(ValueError):
+            compress_streams(None, None, "brotli")
+
+
 class Test_threads:
     @pytest.mark.asyncio
     async def test_threads_run(self):
@@ -129,6 +243,24 @@ class Test_threads:
 
         assert await to_thread(func) == "hello world"
 
+    @pytest.mark.asyncio
+    async def test_threads_deadline(self):
+        def func():
+            return deadline.remaining()
+
+        with deadline(seconds=10):
+            assert 0 < await to_thread(func) <= 10
+
+        with deadline(seconds=0):
+            with pytest.raises(DeadlineExceeded):
+                await to_thread(func)
+
+    @pytest.mark.asyncio
+    async def test_threads_deadline_partial(self):
+        with deadline(seconds=0.1):
+            with pytest.raises(DeadlineExceeded, match="partial"):
+                await to_thread(functools.partial(time.sleep, 0.5))
+
     @pytest.mark.asyncio
     async def test_awaitable(self):
         @awaitable
@@ -1,8 +1,17 @@
+import array
+import configparser
+import gc
+import mmap
+import pickle
+
 import pytest
 from plywoodpirate.collections import (
     BaseDict,
     BidirectionalDict,
     Item,
+    ItemBuffer,
+    ItemPool,
+    ItemArray,
     ObjectDict,
     OverloadedDict,
     UnderscoreAccessDict,
@@ -115,11 +124,200 @@ class Test_item:
         assert repr(Item(True)) == "True"
         assert repr(Item("hello")) == "hello"
 
+    def test_item_cached_representations(self):
+        item = Item("12")
+        assert item.string is item.string
+        assert item.integer == 12
+        item += 3
+        assert item.string == "123"
+        assert item.integer == 123
+        item -= "123"
+        assert item.string == ""
+        assert item.integer is None
+
+    def test_item_buffer_protocol(self, tmp_path):
+        data = bytearray(b"hello 123")
+        item = Item(memoryview(data)[:5])
+        assert item == "hello"
+        assert item.view.readonly
+        assert item.view.obj is data
+        assert len(item) == 5
+        assert item.string == "hello"
+        assert Item(item) == Item(bytearray(b"hello")) == b"hello"
+
+        copy = Item(item)
+        item += " world"
+        assert item == "hello world"
+        assert item.raw == b"hello world"
+        assert copy == "hello"
+        assert data == b"hello 123"
+
+        assert Item(bytearray(b"123")).integer == 123
+        assert hash(Item(bytearray(b"hi"))) == hash(b"hi")
+
+        path = tmp_path / "data"
+        path.write_bytes(b"mapped data")
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            item = Item(memoryview(mapped)[7:])
+            assert item == "data"
+            assert b"at" in item
+            del item
+            mapped.close()
+
+    def test_item_buffer_detach(self):
+        data = bytearray(b"hello")
+        item = Item(data)
+        with pytest.raises(BufferError):
+            data.extend(b"!")
+
+        assert item.string == "hello"
+        data[0:1] = b"j"
+        data.extend(b"!")
+        assert item == "hello" and item.string == "hello"
+        assert item.view.obj is not data
+
     def test_item_byte_item_err(self):
         with pytest.raises(TypeError):
             Item.byte_item(1.5)
 
 
+class Test_item_buffer:
+    def test_item_buffer_append(self):
+        buffer = ItemBuffer("hello")
+        storage = buffer._buffer
+        buffer += " "
+        buffer.append(b"world")
+        buffer += 100
+        buffer += None
+        assert buffer == "hello world100"
+        assert buffer._buffer is storage
+        assert buffer.raw == b"hello world100"
+        assert str(buffer) == "hello world100"
+
+    def test_item_buffer_replace_remove(self):
+        buffer = ItemBuffer("a;b;c;")
+        buffer.replace(";", ", ", count=2)
+        assert buffer == "a, b, c;"
+        buffer -= ";"
+        assert buffer == "a, b, c"
+        del buffer[:3]
+        buffer[0:1] = Item("x")
+        assert buffer == "x, c"
+        assert buffer[0:1] == b"x"
+        assert "c" in buffer
+
+    def test_item_buffer_conversion(self):
+        buffer = ItemBuffer(123)
+        assert buffer.integer == 123
+        assert ItemBuffer("abc").integer is None
+        assert Item(buffer) == Item(123) == buffer.to_item()
+        assert not ItemBuffer()
+        with pytest.raises(TypeError):
+            hash(buffer)
+
+    def test_item_buffer_view(self):
+        buffer = ItemBuffer("hello")
+        with buffer.view() as view:
+            assert view.tobytes() == b"hello"
+            with pytest.raises(BufferError):
+                buffer += "world"
+        buffer += "world"
+        assert buffer == "helloworld"
+
+
+class Test_item_pool:
+    def test_item_intern(self):
+        item = Item.intern("status")
+        assert Item.intern(b"status") is not item
+        assert Item.intern("status") is item
+        assert Item.intern(Item("status")) is item
+        assert Item.intern(bytearray(b"1")).original == bytearray(b"1")
+        assert item == item
+
+        shared = item
+        item += "-ok"
+        assert item == "status-ok"
+        assert shared == "status"
+        assert Item.intern("status") is shared
+
+    def test_item_pool_weak(self):
+        pool = ItemPool()
+        item = pool.intern(100)
+        assert len(pool) == 1
+        del item
+        gc.collect()
+        assert len(pool) == 0
+
+    def test_item_pool_bounded(self):
+        pool = ItemPool(maxsize=2)
+        first = pool.intern("a")
+        pool.intern("b")
+        assert pool.intern("a") is first
+        pool.intern("c")
+        assert len(pool) == 2
+        assert pool.intern("a") is first
+        assert pool.intern("b").original == "b"
+        pool.clear()
+        assert len(pool) == 0
+
+    def test_item_pool_item_dict(self):
+        pool = ItemPool()
+        key, value = pool.intern("status"), pool.intern("ok")
+
+        d = ItemDict({key: value})
+        assert next(iter(d)) is key
+        assert d["status"] is value
+
+        d["other"] = value
+        d[key] = [value]
+        assert d["other"] is value
+        assert d["status"][0] is value
+        assert ItemDict.from_pairs([(key, value)])[key] is value
+
+
+class Test_item_array:
+    def test_item_array_items(self):
+        array = ItemArray(["info", b"error", 500, None, True])
+        assert len(array) == 5
+        assert array[0] == "info"
+        assert array[-1].original is True
+        assert array[2].original == 500
+        assert array[3].original is None
+        assert array.raw(1) == b"error"
+        assert [item.string for item in array] == ["info", "error", "500", "", "1"]
+        assert array[1:3] == ItemArray(["error", 500])
+        with pytest.raises(IndexError):
+            array[5]
+
+    def test_item_array_indices(self):
+        array = ItemArray(["ab", "c", "", "abc", "bc", "ab", ""])
+        assert array.indices("ab") == [0, 5]
+        assert array.indices("bc") == [4]
+        assert array.indices("") == [2, 6]
+        assert array.count(Item("c")) == 1
+        assert array.index("abc") == 3
+        assert "bc" in array
+        assert "ca" not in array
+        with pytest.raises(ValueError):
+            array.index("x")
+
+    def test_item_array_search(self):
+        array = ItemArray(["error: disk", "ok", "error: net", "warning"])
+        assert array.search("error") == [0, 2]
+        assert array.search("r") == [0, 2, 3]
+        assert array.search("kok") == []
+        errors = ItemArray(["error: disk", "error: net"])
+        assert array.take(array.search("error")) == errors
+        assert array.filter(lambda item: len(item) < 3) == ItemArray(["ok"])
+
+    def test_item_array_extend(self):
+        array = ItemArray([1, 2])
+        array.extend(ItemArray([3, "4"]))
+        array.append(Item(5))
+        assert [item.original for item in array] == [1, 2, 3, "4", 5]
+
+
 class Test_mapping:
     class Test_collection_base:
         def test_base_dict_repr(self):
@@ -148,6 +346,58 @@ class Test_mapping:
             assert d["hello"] == "world"
             assert d["world"] == "hello"
 
+        def test_bidirectional_dict_inverse(self):
+            d = BidirectionalDict({"hello": "world"}, ola="mundo")
+            assert len(d) == 2
+            assert list(d) == ["hello", "ola"]
+            assert dict(d.inverse) == {"world": "hello", "mundo": "ola"}
+            assert "mundo" in d
+            assert d.get("mundo") == "ola"
+            with pytest.raises(TypeError):
+                d.inverse["x"] = "y"
+            with pytest.raises(KeyError):
+                d["missing"]
+
+        def test_bidirectional_dict_reassign(self):
+            d = BidirectionalDict({"hello": "world", "ola": "mundo"})
+            d["hello"] = "globe"
+            assert "world" not in d
+            d["hi"] = "mundo"
+            assert "ola" not in d
+            assert dict(d) == {"hello": "globe", "hi": "mundo"}
+            assert dict(d.inverse) == {"globe": "hello", "mundo": "hi"}
+
+        def test_bidirectional_dict_delete(self):
+            d = BidirectionalDict({"hello": "world", "ola": "mundo", "hi": "globe"})
+            del d["hello"]
+            del d["mundo"]
+            assert d.pop("hi") == "globe"
+            assert d.pop("missing", None) is None
+            assert not d and not d.inverse
+
+            d = BidirectionalDict({"hello": "world"})
+            assert d.pop("world") == "hello"
+            assert not d and not d.inverse
+
+        def test_bidirectional_dict_pickle(self):
+            d = BidirectionalDict({"hello": "world"})
+            copy = pickle.loads(pickle.dumps(d))
+            assert copy == d and copy["world"] == "hello"
+            assert d.copy().inverse == d.inverse
+
+        def test_bidirectional_dict_methods_set(self):
+            d = BidirectionalDict({"hello": "world"})
+            d |= {"ola": "mundo", "hello": "globe"}
+            assert d["mundo"] == "ola" and d["globe"] == "hello"
+            assert "world" not in d
+
+            merged = d | {"hi": "there"}
+            assert isinstance(merged, BidirectionalDict)
+            assert merged["there"] == "hi" and "there" not in d
+
+            d = BidirectionalDict.fromkeys(["hello"], "world")
+            assert isinstance(d, BidirectionalDict) and d["world"] == "hello"
+
     class Test_collection_object:
         def test_object_dict_type(self):
             assert isinstance(ObjectDict(), dict)
@@ -218,6 +468,46 @@ class Test_mapping:
             assert d[b"key"] == "value"
             assert d[b"_100"] == "one hundred"
 
+        def test_underscore_access_distinct_keys(self):
+            d = UnderscoreAccessDict({"ab": 1, "a b": 2, b"ab": 3, b"a b": 4})
+            assert dict(d) == {"ab": 1, "a b": 2, b"ab": 3, b"a b": 4}
+            assert d["a_b"] == 2 and d["_ab"] == 1
+            assert d[b"a_b"] == 4 and d[b"_ab"] == 3
+
+            d["a_b"] = 5
+            assert dict(d) == {"ab": 1, "a b": 5, b"ab": 3, b"a b": 4}
+
+        def test_underscore_access_methods(self):
+            d = UnderscoreAccessDict({"hello world": 1, 2: "two"})
+            assert "hello_world" in d and "hello world" in d and 2 in d
+            assert d.get("hello_world") == 1
+            assert d.get("missing", 0) == 0
+
+            d["hello_world"] = 3
+            assert dict(d) == {"hello world": 3, 2: "two"}
+            assert d.setdefault("hello_world", 4) == 3
+            assert d.setdefault("new key", 5) == 5
+            assert d.pop("new_key") == 5
+            assert d.pop("new_key", None) is None
+
+            del d["hello_world"]
+            assert "hello world" not in d
+            with pytest.raises(KeyError):
+                d["hello_world"]
+            assert pickle.loads(pickle.dumps(d))[2] == "two"
+
+        def test_underscore_access_methods_set(self):
+            d = UnderscoreAccessDict({"hello world": 1})
+            d |= {"hello world": 2}
+            assert d["hello_world"] == 2
+
+            merged = d | {"hello_world": 3}
+            assert isinstance(merged, UnderscoreAccessDict)
+            assert dict(merged) == {"hello world": 3} and d["hello_world"] == 2
+
+            d = UnderscoreAccessDict.fromkeys(["hello world"], 4)
+            assert isinstance(d, UnderscoreAccessDict) and d["hello_world"] == 4
+
     class Test_collection_frozen:
         def test_frozen_init(self):
             d = FrozenDict({"hello": "world"})
@@ -234,11 +524,72 @@ class Test_mapping:
     class Test_collection_multi:
         def test_multi_init(self):
             d = MultiEntryDict({"hello": "world", "hello": "mundo"})
-            assert d["hello"] == "mundo"
+            assert d["hello"] == ["mundo"]
 
             d["hello"] = "globo"
             assert d["hello"] == ["mundo", "globo"]
 
+        def test_multi_methods(self):
+            d = MultiEntryDict([("a", 1), ("b", 2), ("a", 3)])
+            d.add("b", 4)
+            d.extend({"c": 5})
+            assert d.getall("a") == [1, 3]
+            assert d.getone("b") == 2
+            assert d.count("a") == 2 and d.count("missing") == 0
+            assert d.getall("missing", []) == []
+            with pytest.raises(KeyError):
+                d.getone("missing")
+            items = [("a", 1), ("a", 3), ("b", 2), ("b", 4), ("c", 5)]
+            assert list(d.items(multi=True)) == items
+            assert d.copy() == d
+            assert pickle.loads(pickle.dumps(d)) == d
+
+        def test_multi_typecode(self):
+            d = MultiEntryDict(typecode="d")
+            d.extend([("latency", 0.5), ("latency", 1.5)])
+            assert isinstance(d["latency"], array.array)
+            assert d.getall("latency") == [0.5, 1.5]
+            with pytest.raises(TypeError):
+                d.add("latency", "slow")
+
+        def test_multi_dict_methods_add(self):
+            d = MultiEntryDict()
+            assert d.setdefault("x", "scalar") == ["scalar"]
+            assert d.setdefault("x", "other") == ["scalar"]
+
+            d |= {"x": "more", "y": 1}
+            assert d == {"x": ["scalar", "more"], "y": [1]}
+            assert isinstance(d, MultiEntryDict)
+
+            merged = d | {"y": 2}
+            assert isinstance(merged, MultiEntryDict)
+            assert merged["y"] == [1, 2] and d["y"] == [1]
+
+            assert MultiEntryDict.fromkeys("ab", 0) == {"a": [0], "b": [0]}
+
+        def test_multi_mixins(self):
+            Multi = type("Multi", (MultiEntryDict, ObjectDict), {})
+            d = Multi({"k": "v"})
+            d.k = "w"
+            assert d.k == d["k"] == ["v", "w"]
+
+            for mixin in (UnderscoreAccessDict, ItemDict):
+                d = type("Multi", (MultiEntryDict, mixin), {})()
+                d["k"] = "v"
+                d["k"] = "w"
+                assert d["k"] == ["v", "w"]
+
+    class Test_collection_mixins:
+        def test_object_bidirectional(self):
+            d = type("Object", (ObjectDict, BidirectionalDict), {})({"hello": "world"})
+            d.ola = "mundo"
+            assert d.ola == "mundo" and d["mundo"] == "ola"
+
+        def test_object_underscore(self):
+            d = type("Object", (ObjectDict, UnderscoreAccessDict), {})()
+            d["hello world"] = "ola mundo"
+            assert d.hello_world == "ola mundo"
+
     class Test_collection_item:
         def test_item_init(self):
             d = ItemDict({"100": "one hundred"})
@@ -266,6 +617,28 @@ class Test_mapping:
             assert 100 in d
             assert Item(100) in d
 
+        def test_item_fast_path(self):
+            d = ItemDict({100: "one hundred"})
+            d["100"] = "hundred"
+            d[b"new"] = 1
+            assert [type(k) for k in d] == [Item, Item]
+            assert list(d)[0].original == 100
+            assert d.get(b"100") == d.get(100) == "hundred"
+            assert d.get("missing", 0) == 0
+            assert True not in d
+
+        def test_item_copy(self):
+            key, value = Item("a"), Item("1")
+            d = ItemDict({key: value})
+            key += "b"
+            value += "2"
+            assert d["a"] == "1" and "ab" not in d
+
+            pool = ItemPool()
+            shared = pool.intern("a")
+            d = ItemDict({shared: shared})
+            assert next(iter(d)) is shared and d[shared] is shared
+
         def test_item_update(self):
             d = ItemDict()
             d.update({"100": "one hundred"})
@@ -274,8 +647,67 @@ class Test_mapping:
             assert 100 in d
             assert Item(100) in d
 
+        def test_item_update_list(self):
+            d = ItemDict([("a", 1)], b=[1, "2"])
+            d.update({"c": [3]})
+            assert d["b"] == [Item(1), Item(2)]
+            assert d["c"] == [Item(3)]
+
+        def test_item_from_pairs(self):
+            d = ItemDict.from_pairs(((i, str(i)) for i in range(3)), size_hint=3)
+            assert d[b"2"] == "2"
+            assert len(d) == 3
+
+        def test_item_from_file(self, tmp_path):
+            path = tmp_path / "table.txt"
+            path.write_text("# comment\n\n100 = one = hundred\nkey=value\n")
+            d = ItemDict.from_file(path)
+            assert d[100] == "one = hundred"
+            assert d["key"] == "value"
+
+            path.write_text("broken line\n")
+            with pytest.raises(ValueError):
+                ItemDict.from_file(path)
+
+        def test_item_from_configparser(self):
+            parser = configparser.ConfigParser()
+            parser.read_string("[server]\nport = 8080\nurl = http://host:%(port)s\n")
+            d = ItemDict.from_configparser(parser["server"])
+            assert d["port"] == 8080
+            assert d["url"] == "http://host:8080"
+
 
 class Test_namedtuple:
+    def test_nestednamedtuple_lazy(self):
+        source = {"d": {"hello": "world"}, "l": [{"ola": "mundo"}, 1], "f": fdict(a=1)}
+        nt = nestednamedtuple(source, lazy=True)
+        assert nt.d.hello == "world"
+        assert nt.d is nt.d
+        assert nt.l[0].ola == "mundo"
+        assert nt.l[-1] == 1 and len(nt.l) == 2
+        assert nt.f == {"a": 1}
+        assert nt._fields == ("d", "l", "f")
+        assert nt[0] == nt.d
+        assert nt == nestednamedtuple(source)
+        assert source == {
+            "d": {"hello": "world"},
+            "l": [{"ola": "mundo"}, 1],
+            "f": {"a": 1},
+        }
+        assert repr(nt.d) == "namedtupled(hello='world')"
+
+        with pytest.raises(AttributeError):
+            nt.missing
+        with pytest.raises(AttributeError):
+            nt.d = 1
+
+    def test_nestednamedtuple_class_cache(self):
+        first = nestednamedtuple({"id": 1, "owner": {"name": "a"}})
+        second = nestednamedtuple({"id": 2, "owner": {"name": "b"}})
+        assert type(first) is type(second)
+        assert type(first.owner) is type(second.owner)
+        assert type(nestednamedtuple({"owner": 1, "id": 2})) is not type(first)
+
     def test_reg_nestednamedtuple(self):
         nt = nestednamedtuple({"d": {"hello": "world"}})
         assert isinstance(nt, tuple)
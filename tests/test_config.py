@@ -1,7 +1,10 @@
+import asyncio
+import threading
+
 from plywoodpirate.collections import namedtuple
 
 import pytest
-from plywoodpirate.config import conf, config, make_config
+from plywoodpirate.config import conf, config, config_override, make_config, snapshot
 
 
 class Test_make_config:
@@ -18,3 +21,114 @@ class Test_make_config:
     def test_make_config_and_conf(self):
         make_config(hello="world")
         assert conf().hello == "world"
+
+    def test_make_config_snapshot(self):
+        make_config({"server": {"port": 80}}, debug=True)
+        before = snapshot()
+        assert conf() is conf()
+        assert conf().server.port == 80
+        assert config()["server"] == {"port": 80}
+        with pytest.raises(KeyError):
+            config()["debug"] = False
+
+        make_config(debug=False)
+        assert snapshot().version == before.version + 1
+        assert before.conf.debug is True
+        assert conf().debug is False
+
+    def test_make_config_immutable(self):
+        settings = {"hello": "world", "db": {"host": "db"}}
+        make_config(settings)
+        for mutate in (
+            lambda: config().pop("hello"),
+            lambda: config().__delitem__("hello"),
+            lambda: config().clear(),
+            lambda: config().popitem(),
+            lambda: config().setdefault("new", 1),
+            lambda: config()["db"].__setitem__("host", "mutated"),
+            lambda: config()["db"].pop("host"),
+        ):
+            with pytest.raises(KeyError):
+                mutate()
+
+        settings["db"]["host"] = "mutated"
+        assert config() == {"hello": "world", "db": {"host": "db"}}
+        assert conf().db.host == "db"
+
+    def test_make_config_containers(self):
+        lock = threading.Lock()
+        hosts = ["a", {"name": "b"}]
+        make_config(hosts=hosts, tags={"x"}, lock=lock)
+        hosts.append("c")
+        assert config()["hosts"] == ("a", {"name": "b"})
+        assert conf().hosts[1].name == "b"
+        assert config()["tags"] == frozenset({"x"})
+        assert config()["lock"] is conf().lock is lock
+        with pytest.raises(AttributeError):
+            config()["hosts"].append("c")
+
+        with config_override(hosts=["d"], lock=lock):
+            assert config()["hosts"] == conf().hosts == ("d",)
+            assert conf().lock is lock
+
+
+class Test_config_override:
+    def test_config_override(self):
+        make_config(timeout=30, db={"host": "db", "pool": 10})
+        with config_override(timeout=5, db={"pool": 2}):
+            assert conf().timeout == 5
+            assert conf() is conf()
+            assert config()["db"] == {"host": "db", "pool": 2}
+            with config_override(timeout=1):
+                assert conf().timeout == 1
+                assert conf().db.pool == 2
+            assert conf().timeout == 5
+
+            make_config(timeout=60, db={"host": "replica"})
+            assert conf().timeout == 5
+            assert conf().db.host == "replica"
+        assert conf().timeout == 60
+
+    def test_config_override_threads(self):
+        make_config(tenant="default")
+        seen = []
+
+        def read():
+            seen.append(conf().tenant)
+
+        with config_override(tenant="a"):
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join()
+            assert conf().tenant == "a"
+        assert seen == ["default"]
+
+    @pytest.mark.asyncio
+    async def test_config_override_tasks(self):
+        make_config(tenant="default")
+
+        async def handle(tenant):
+            async with config_override(tenant=tenant):
+                await asyncio.sleep(0.01)
+                return conf().tenant
+
+        assert await asyncio.gather(handle("a"), handle("b")) == ["a", "b"]
+        assert conf().tenant == "default"
+
+    @pytest.mark.asyncio
+    async def test_config_override_shared_instance(self):
+        make_config(tenant="default", db={"host": "db"})
+        shared = config_override(tenant="shared")
+
+        with shared:
+            first = snapshot()
+        with shared:
+            assert snapshot() is first
+
+        async def handle(delay):
+            async with shared:
+                await asyncio.sleep(delay)
+                return conf().tenant
+
+        assert await asyncio.gather(handle(0.02), handle(0.01)) == ["shared"] * 2
+        assert conf().tenant == "default"
@@ -1,8 +1,31 @@
 import asyncio
+import gc
+import signal
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
-from plywoodpirate.functools import timeout
+from plywoodpirate.functools import (
+    CircuitOpenError,
+    DeadlineExceeded,
+    Histogram,
+    LatencyTracker,
+    RateLimitExceeded,
+    RetryBudget,
+    SlidingWindow,
+    TokenBucket,
+    async_cached_property,
+    cached_method,
+    circuit_breaker,
+    deadline,
+    debounce,
+    hedge,
+    profiled,
+    rate_limit,
+    retry,
+    throttle,
+    timeout,
+)
 
 
 class Test_sync_timeout:
@@ -41,6 +64,116 @@ class Test_sync_timeout:
         with pytest.raises(TimeoutError):
             sync_time_sleep_10()
 
+    def test_timeout_sync_sub_second(self):
+        @timeout(seconds=0.2)
+        def sync_time_sleep_10():
+            time.sleep(10)
+            return True
+
+        start = time.time()
+        ret = sync_time_sleep_10()
+        end = time.time()
+
+        assert end - start <= 0.5
+        assert ret is None
+
+    def test_timeout_sync_restores_handler(self):
+        def handler(signum, frame):
+            pass
+
+        previous = signal.signal(signal.SIGALRM, handler)
+        try:
+
+            @timeout(seconds=1)
+            def sync_time_sleep_01():
+                time.sleep(0.1)
+                return True
+
+            assert sync_time_sleep_01() is True
+            assert signal.getsignal(signal.SIGALRM) is handler
+            assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+        finally:
+            signal.signal(signal.SIGALRM, previous)
+
+    def test_timeout_sync_nested(self):
+        @timeout(seconds=0.2, error=True)
+        def inner():
+            time.sleep(10)
+
+        @timeout(seconds=5)
+        def outer():
+            try:
+                inner()
+            except TimeoutError:
+                return "inner timed out"
+
+        start = time.time()
+        assert outer() == "inner timed out"
+        assert time.time() - start <= 1.0
+
+        @timeout(seconds=5)
+        def long_inner():
+            time.sleep(10)
+            return True
+
+        @timeout(seconds=0.2)
+        def short_outer():
+            long_inner()
+            return True
+
+        start = time.time()
+        assert short_outer() is None
+        assert time.time() - start <= 1.0
+
+    def test_timeout_sync_thread(self):
+        @timeout(seconds=0.2, error=True)
+        def busy():
+            while True:
+                pass
+
+        @timeout(seconds=1)
+        def quick():
+            return True
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            start = time.time()
+            with pytest.raises(TimeoutError):
+                executor.submit(busy).result()
+            assert time.time() - start <= 1.0
+            assert executor.submit(quick).result() is True
+
+    def test_timeout_sync_zero(self):
+        @timeout()
+        def sync_time_sleep_01():
+            time.sleep(0.1)
+            return True
+
+        assert sync_time_sleep_01() is True
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_timeout_async_zero(self):
+        @timeout(error=True)
+        async def async_sleep_01():
+            await asyncio.sleep(0.1)
+            return True
+
+        assert await async_sleep_01() is True
+
+    def test_timeout_sync_thread_discards_closed_scopes(self):
+        from plywoodpirate.functools.timeout import _ThreadScope
+
+        @timeout(hours=1)
+        def quick():
+            return True
+
+        def run():
+            return all(quick() for _ in range(1000))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(run).result() is True
+        assert len(_ThreadScope.watchdog._heap) <= 500
+
 
 class Test_async_timeout:
     @pytest.mark.asyncio
@@ -80,3 +213,680 @@ class Test_async_timeout:
 
         with pytest.raises(TimeoutError):
             await async_time_sleep_10()
+
+
+class Test_deadline:
+    def test_deadline_remaining(self):
+        assert deadline.remaining() is None
+        assert deadline.expired() is False
+
+        with deadline(seconds=10):
+            assert 9 < deadline.remaining() <= 10
+            with deadline(seconds=1):
+                assert deadline.remaining() <= 1
+                with deadline(seconds=60):
+                    assert deadline.remaining() <= 1
+            assert deadline.remaining() > 9
+
+        assert deadline.remaining() is None
+
+    def test_deadline_check(self):
+        with deadline(seconds=0):
+            assert deadline.expired()
+            with pytest.raises(DeadlineExceeded):
+                deadline.check()
+
+    def test_deadline_timeout_fail_fast(self):
+        calls = []
+
+        @timeout(seconds=1, error=True)
+        def func():
+            calls.append(True)
+
+        with deadline(seconds=0):
+            with pytest.raises(DeadlineExceeded):
+                func()
+        assert calls == []
+
+    def test_deadline_timeout_propagation(self):
+        @timeout(seconds=0.5)
+        def func():
+            return deadline.remaining()
+
+        assert func() <= 0.5
+
+        with deadline(seconds=0.2):
+            assert func() <= 0.2
+
+    @pytest.mark.asyncio
+    async def test_deadline_async_timeout(self):
+        @timeout(seconds=5, error=True)
+        async def func():
+            await asyncio.sleep(10)
+
+        start = time.time()
+        async with deadline(seconds=0.2):
+            with pytest.raises(TimeoutError):
+                await func()
+        assert time.time() - start <= 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_shared_instance(self):
+        shared = deadline(seconds=10)
+
+        async def task(delay):
+            async with shared:
+                await asyncio.sleep(delay)
+                return deadline.remaining()
+
+        results = await asyncio.gather(task(0.1), task(0.05))
+        assert all(0 < remaining <= 10 for remaining in results)
+        assert deadline.remaining() is None
+
+
+class Test_retry:
+    def test_retry_sync_exception(self):
+        calls = []
+
+        @retry(exceptions=ValueError, attempts=3, backoff=0.01, budget=None)
+        def func():
+            calls.append(True)
+            if len(calls) < 3:
+                raise ValueError
+            return True
+
+        assert func() is True
+        assert len(calls) == 3
+
+    def test_retry_sync_exhausted(self):
+        calls = []
+
+        @retry(attempts=2, backoff=0.01, budget=None)
+        def func():
+            calls.append(True)
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            func()
+        assert len(calls) == 2
+
+    def test_retry_sync_unmatched_exception(self):
+        calls = []
+
+        @retry(exceptions=lambda err: isinstance(err, KeyError), budget=None)
+        def func():
+            calls.append(True)
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            func()
+        assert len(calls) == 1
+
+    def test_retry_sync_result(self):
+        calls = []
+
+        @retry(
+            result=lambda value: value is None, attempts=5, backoff=0.01, budget=None
+        )
+        def func():
+            calls.append(True)
+            return None if len(calls) < 2 else "done"
+
+        assert func() == "done"
+        assert len(calls) == 2
+
+    def test_retry_max_elapsed(self):
+        calls = []
+
+        @retry(attempts=100, backoff=0.5, cap=0.5, max_elapsed=0.2, budget=None)
+        def func():
+            calls.append(True)
+            raise ValueError
+
+        start = time.time()
+        with pytest.raises(ValueError):
+            func()
+        assert time.time() - start <= 0.5
+
+    def test_retry_budget(self):
+        budget = RetryBudget(max_tokens=4, token_ratio=1)
+        calls = []
+
+        @retry(attempts=10, backoff=0.001, budget=budget)
+        def func():
+            calls.append(True)
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            func()
+        assert len(calls) == 2
+        assert not budget.can_retry()
+
+        budget.record_success()
+        assert budget.can_retry()
+
+    @pytest.mark.asyncio
+    async def test_retry_async(self):
+        calls = []
+
+        @retry(exceptions=(KeyError, ValueError), backoff=0.01, budget=None)
+        async def func():
+            calls.append(True)
+            if len(calls) < 2:
+                raise KeyError
+            return True
+
+        assert await func() is True
+        assert len(calls) == 2
+
+
+class Test_ratelimit:
+    def test_token_bucket_try_acquire(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+        assert bucket.try_acquire(key="other")
+
+        time.sleep(0.11)
+        assert bucket.try_acquire()
+
+    def test_token_bucket_acquire(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        start = time.time()
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.time() - start
+
+        assert 0.15 <= elapsed <= 0.5
+
+    def test_sliding_window_try_acquire(self):
+        window = SlidingWindow(limit=3, period=0.2)
+        assert all(window.try_acquire() for _ in range(3))
+        assert not window.try_acquire()
+
+        time.sleep(0.21)
+        assert window.try_acquire()
+
+    def test_sliding_window_acquire(self):
+        window = SlidingWindow(limit=2, period=0.1)
+
+        start = time.time()
+        for _ in range(6):
+            window.acquire()
+        elapsed = time.time() - start
+
+        assert 0.2 <= elapsed <= 0.5
+
+    def test_rate_limit_drops_idle_keys(self):
+        bucket = TokenBucket(rate=1000, capacity=1)
+        window = SlidingWindow(limit=1, period=0.001)
+        for key in range(1000):
+            assert bucket.try_acquire(key)
+            assert window.try_acquire(key)
+            time.sleep(0.0001)
+
+        assert len(bucket._states) < 500
+        assert len(window._states) < 500
+
+    def test_rate_limit_sync(self):
+        @rate_limit(TokenBucket(rate=1, capacity=1), key=lambda k: k, block=False)
+        def func(k):
+            return k
+
+        assert func("a") == "a"
+        assert func("b") == "b"
+        with pytest.raises(RateLimitExceeded):
+            func("a")
+
+    def test_rate_limit_deadline(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+
+        with deadline(seconds=0.1):
+            with pytest.raises(DeadlineExceeded):
+                bucket.acquire()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_async(self):
+        window = SlidingWindow(limit=2, period=0.1)
+
+        @window
+        async def func():
+            return True
+
+        start = time.time()
+        assert all(await asyncio.gather(*(func() for _ in range(6))))
+        assert 0.2 <= time.time() - start <= 0.5
+
+        async with window:
+            pass
+
+
+class Test_circuit_breaker:
+    def test_circuit_breaker_opens(self):
+        changes = []
+
+        @circuit_breaker(
+            minimum_calls=4,
+            recovery=0.1,
+            on_state_change=lambda breaker, old, new: changes.append(new),
+        )
+        def func(fail):
+            if fail:
+                raise ConnectionError
+            return True
+
+        assert func(False) and func(False)
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                func(True)
+
+        assert func.breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            func(False)
+
+        time.sleep(0.11)
+        assert func.breaker.state == "half-open"
+        assert func(False) is True
+        assert func.breaker.state == "closed"
+        assert changes == ["open", "half-open", "closed"]
+
+    def test_circuit_breaker_probe_fails(self):
+        @circuit_breaker(minimum_calls=1, recovery=0.1)
+        def func():
+            raise ConnectionError
+
+        with pytest.raises(ConnectionError):
+            func()
+        time.sleep(0.11)
+        with pytest.raises(ConnectionError):
+            func()
+        assert func.breaker.state == "open"
+
+    def test_circuit_breaker_ignored_exceptions(self):
+        @circuit_breaker(minimum_calls=1, exceptions=ConnectionError)
+        def func():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            func()
+        assert func.breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_latency(self):
+        @circuit_breaker(minimum_calls=2, latency=0.05)
+        async def func():
+            await asyncio.sleep(0.1)
+            return True
+
+        assert await func() and await func()
+        with pytest.raises(CircuitOpenError):
+            await func()
+
+
+class Test_hedge:
+    @pytest.mark.asyncio
+    async def test_hedge_after(self):
+        delays = [10, 0.05]
+        cancelled = []
+
+        @hedge(after=0.05)
+        async def func():
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+
+        start = time.time()
+        assert await func() == 0.05
+        assert time.time() - start <= 0.5
+        await asyncio.sleep(0)
+        assert cancelled == [10]
+
+    @pytest.mark.asyncio
+    async def test_hedge_no_extra_when_fast(self):
+        calls = []
+
+        @hedge(after=0.5)
+        async def func():
+            calls.append(True)
+            return True
+
+        assert await func() is True
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_all_failed(self):
+        @hedge(after=0.01, max_extra=2)
+        async def func():
+            await asyncio.sleep(0.05)
+            raise ConnectionError
+
+        with pytest.raises(ConnectionError):
+            await func()
+
+    @pytest.mark.asyncio
+    async def test_hedge_tracker(self):
+        tracker = LatencyTracker()
+        for _ in range(20):
+            tracker.record(0.01)
+        delays = [10, 0.01]
+
+        @hedge(tracker=tracker)
+        async def func():
+            delay = delays.pop(0)
+            await asyncio.sleep(delay)
+            return delay
+
+        assert await func() == 0.01
+        assert func.tracker is tracker
+        assert len(tracker) == 21
+        # The slow primary attempt is reflected, not only the fast hedged one.
+        assert tracker._samples[-1] >= 0.02
+
+    def test_hedge_sync_err(self):
+        with pytest.raises(TypeError):
+            hedge(after=1)(lambda: None)
+
+
+class Test_coalesce:
+    def test_debounce_sync(self):
+        calls = []
+
+        @debounce(wait=0.05)
+        def func(value):
+            calls.append(value)
+
+        for i in range(10):
+            func(i)
+        assert calls == []
+
+        time.sleep(0.2)
+        assert calls == [9]
+
+    def test_debounce_sync_aggregate(self):
+        calls = []
+
+        @debounce(wait=0.05, aggregate=True)
+        def func(collapsed):
+            calls.append([args[0] for args, kwargs in collapsed])
+
+        for i in range(3):
+            func(i)
+        time.sleep(0.2)
+        assert calls == [[0, 1, 2]]
+
+    def test_debounce_sync_cancel(self):
+        calls = []
+
+        @debounce(wait=0.05)
+        def func():
+            calls.append(True)
+
+        func()
+        func.cancel()
+        time.sleep(0.1)
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_debounce_async(self):
+        calls = []
+
+        @debounce(wait=0.05)
+        async def func(value):
+            calls.append(value)
+            return value * 2
+
+        results = await asyncio.gather(*(func(i) for i in range(5)))
+        assert calls == [4]
+        assert results == [8] * 5
+
+    def test_throttle_sync(self):
+        calls = []
+
+        @throttle(interval=0.1)
+        def func(value):
+            calls.append(value)
+            return value
+
+        assert func(0) == 0
+        for i in range(1, 5):
+            assert func(i) is None
+        assert calls == [0]
+
+        time.sleep(0.2)
+        assert calls == [0, 4]
+
+    def test_throttle_sync_no_trailing(self):
+        calls = []
+
+        @throttle(interval=0.1, trailing=False)
+        def func(value):
+            calls.append(value)
+
+        for i in range(5):
+            func(i)
+        time.sleep(0.15)
+        func(5)
+        assert calls == [0, 5]
+
+    @pytest.mark.asyncio
+    async def test_throttle_async_aggregate(self):
+        calls = []
+
+        @throttle(interval=0.05, aggregate=True)
+        async def func(collapsed):
+            calls.append([args[0] for args, kwargs in collapsed])
+            return len(collapsed)
+
+        results = await asyncio.gather(*(func(i) for i in range(4)))
+        assert calls == [[0], [1, 2, 3]]
+        assert results == [1, 3, 3, 3]
+
+
+class Test_cached:
+    def test_cached_method(self):
+        calls = []
+
+        class Service:
+            @cached_method
+            def double(self, value):
+                calls.append(value)
+                return value * 2
+
+        service = Service()
+        assert service.double is service.double
+        assert service.double(2) == 4
+        assert service.double(2) == 4
+        assert Service.double(service, 2) == 4
+        assert calls == [2]
+
+        other = Service()
+        assert other.double(2) == 4
+        assert calls == [2, 2]
+
+        service.double.cache_clear()
+        assert service.double(2) == 4
+        assert calls == [2, 2, 2]
+
+    def test_cached_method_maxsize_ttl(self):
+        calls = []
+
+        class Service:
+            @cached_method(maxsize=2, ttl=0.05)
+            def double(self, value):
+                calls.append(value)
+                return value * 2
+
+        service = Service()
+        for value in (1, 2, 3, 1):
+            service.double(value)
+        assert calls == [1, 2, 3, 1]
+        assert service.double.cache_len() == 2
+
+        time.sleep(0.1)
+        service.double(1)
+        assert calls == [1, 2, 3, 1, 1]
+
+    def test_cached_method_releases_instance(self):
+        class Service:
+            @cached_method
+            def value(self):
+                return object()
+
+        service = Service()
+        service.value()
+        assert len(Service.value._caches) == 1
+
+        del service
+        gc.collect()
+        assert len(Service.value._caches) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_cached_property(self):
+        calls = []
+
+        class Service:
+            @async_cached_property
+            async def settings(self):
+                calls.append(1)
+                await asyncio.sleep(0.05)
+                return {"debug": True}
+
+        service = Service()
+        results = await asyncio.gather(*(service.settings for _ in range(5)))
+        assert results == [{"debug": True}] * 5
+        assert await service.settings == {"debug": True}
+        assert calls == [1]
+
+        del service.settings
+        await service.settings
+        assert calls == [1, 1]
+
+        with pytest.raises(AttributeError):
+            service.settings = None
+
+    @pytest.mark.asyncio
+    async def test_async_cached_property_retries_failure(self):
+        calls = []
+
+        class Service:
+            @async_cached_property
+            async def settings(self):
+                calls.append(1)
+                if len(calls) == 1:
+                    raise ConnectionError()
+                return "ok"
+
+        service = Service()
+        with pytest.raises(ConnectionError):
+            await service.settings
+        assert await service.settings == "ok"
+        assert calls == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_async_cached_property_cancel_waiter(self):
+        class Service:
+            @async_cached_property
+            async def settings(self):
+                await asyncio.sleep(0.05)
+                return "ok"
+
+        service = Service()
+        waiter = asyncio.ensure_future(service.settings)
+        other = service.settings
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await other == "ok"
+
+
+class Test_profiled:
+    def test_histogram(self):
+        histogram = Histogram()
+        for value in range(1, 10001):
+            histogram.record(value * 1000)
+
+        assert len(histogram) == 10000
+        assert histogram.mean == 5000500
+        for q in (50, 90, 99):
+            exact = q * 100 * 1000
+            assert exact <= histogram.percentile(q) <= exact * 1.01
+        assert histogram.min == 1000
+        assert 10000000 <= histogram.max <= 10100000
+
+        other = histogram.copy()
+        other.merge(histogram)
+        assert len(other) == 20000
+        assert other.percentile(50) == histogram.percentile(50)
+
+        histogram.reset()
+        assert len(histogram) == 0
+        assert histogram.percentile(50) is None
+
+        with pytest.raises(ValueError):
+            histogram.merge(Histogram(bits=4))
+
+    def test_profiled_sync(self):
+        profiled.reset()
+
+        @profiled("test.sync")
+        def func(fail=False):
+            time.sleep(0.01)
+            if fail:
+                raise ValueError()
+
+        func()
+        with pytest.raises(ValueError):
+            func(fail=True)
+
+        profile = profiled.snapshot()["test.sync"]
+        summary = profile.summary()
+        assert summary["calls"] == 2
+        assert summary["errors"] == 1
+        assert 0.01 <= summary["p50"] < 0.1
+
+        profiled.merge({"test.sync": profile})
+        assert profiled.snapshot()["test.sync"].calls == 4
+
+        profiled.reset("test.sync")
+        assert profiled.snapshot()["test.sync"].calls == 0
+
+    @pytest.mark.asyncio
+    async def test_profiled_async_and_context_manager(self):
+        @profiled()
+        async def func():
+            await asyncio.sleep(0.01)
+
+        await func()
+        async with profiled("test.block"):
+            await func()
+
+        snapshot = profiled.snapshot()
+        assert snapshot[func.__module__ + "." + func.__qualname__].calls == 2
+        assert snapshot["test.block"].calls == 1
+        assert snapshot["test.block"].histogram.min >= 9900000
+
+    @pytest.mark.asyncio
+    async def test_profiled_context_manager_shared(self):
+        profiled.reset("test.shared")
+        block = profiled("test.shared")
+
+        async def handle(delay, duration):
+            await asyncio.sleep(delay)
+            async with block:
+                await asyncio.sleep(duration)
+
+        await asyncio.gather(handle(0, 0.02), handle(0.01, 0.04))
+        histogram = profiled.snapshot()["test.shared"].histogram
+        assert histogram.min >= 19800000 and histogram.max >= 39600000
+
+    def test_profiled_context_manager_without_name(self):
+        with pytest.raises(ValueError):
+            with profiled():
+                pass
+        assert None not in profiled.snapshot()